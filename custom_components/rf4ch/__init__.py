@@ -1,52 +1,83 @@
 """RF Four Channel integration."""
 
-import asyncio
 import json
 import logging
 from types import MappingProxyType
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import SOURCE_IMPORT, SOURCE_USER, ConfigEntry
-from homeassistant.core import HomeAssistant
-import homeassistant.helpers.config_validation as cv
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers.typing import ConfigType
 
-from . import helpers
-from .const import CONF_UNIQUE_ID, DOMAIN, PLATFORMS
-from .schema import SWITCHER_CONFIG_SCHEMA
-from .services import async_setup_dummy_rf_send_service
+from . import tracing
+from .const import (
+    CONF_COORDINATOR,
+    CONF_SERVE,
+    CONF_SOCKET,
+    CONF_UNIQUE_ID,
+    DOMAIN,
+    PLATFORMS,
+)
+from .lib.encoding import InvalidCodeError
+from .lib.scheduler import QueueItem, RfScheduler
+from .lib.switcher import SwitcherCode
+from .resync import async_setup_resync
+from .schema import DOMAIN_CONFIG_SCHEMA
+from .services import (
+    async_setup_dummy_rf_send_service,
+    async_setup_profile_services,
+    async_setup_recording_services,
+    async_setup_snapshot_services,
+)
 from .switcher import RfSwitcher
 
+if TYPE_CHECKING:
+    from .lib.coordinator import CoordinatorClient
+
 _LOGGER = logging.getLogger(__name__)
 
 ATTR_QUEUE = "RF_QUEUE"
-DEFAULT_TRANSMISSION_GAP = 0.25  # in seconds
+ATTR_COORDINATOR = "RF_COORDINATOR"
+SHUTDOWN_DRAIN_TIMEOUT = 5  # in seconds
+BRIDGE_FAILOVER_COOLDOWN = 30  # in seconds
 
-CONFIG_SCHEMA = vol.Schema(
-    {DOMAIN: cv.schema_with_slug_keys(SWITCHER_CONFIG_SCHEMA)},
-    extra=vol.ALLOW_EXTRA,
-)
+CONFIG_SCHEMA = vol.Schema({DOMAIN: DOMAIN_CONFIG_SCHEMA}, extra=vol.ALLOW_EXTRA)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the RF Four Channel Integration using Config."""
 
+    async_setup_queue(hass, config.get(DOMAIN, {}).get(CONF_COORDINATOR))
+    async_setup_recording_services(hass)
+    async_setup_profile_services(hass)
+    async_setup_snapshot_services(hass)
+
     if DOMAIN not in config:
         return True
 
+    from . import helpers  # pylint: disable=import-outside-toplevel
+
     # Register our services with Home Assistant.
     async_setup_dummy_rf_send_service(hass)
 
+    switchers = {
+        unique_id: config_entry
+        for unique_id, config_entry in config[DOMAIN].items()
+        if unique_id != CONF_COORDINATOR
+    }
+
     # Delete redundant exisiting entries
     for entry in hass.config_entries.async_entries(DOMAIN):
-        if entry.source == SOURCE_USER:
+        if entry.source != SOURCE_IMPORT:
             continue
-        if entry.source == SOURCE_IMPORT and next(
+        if next(
             (
                 config_entry
-                for unique_id, config_entry in config[DOMAIN].items()
+                for unique_id, config_entry in switchers.items()
                 if unique_id == entry.data[CONF_UNIQUE_ID]
             ),
             None,
@@ -67,7 +98,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             json.dumps({k: a[k] for k in dict.keys(a)}, sort_keys=True)
         ) == hash(json.dumps({k: b.get(k, None) for k in dict.keys(a)}, sort_keys=True))
 
-    for unique_id, config_entry in config[DOMAIN].items():
+    for unique_id, config_entry in switchers.items():
         _found = next(
             (
                 entry
@@ -103,49 +134,123 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 )
             )
 
-    # Setup Queue
-    if DOMAIN not in hass.data:
-        hass.data.setdefault(DOMAIN, {})
+    return True
 
-    hass.data[DOMAIN][ATTR_QUEUE] = asyncio.Queue()
 
-    async def async_queue_worker():
-        while True:
-            queue: asyncio.Queue = hass.data[DOMAIN][ATTR_QUEUE]
-            data = await queue.get()
+@callback
+def async_setup_queue(
+    hass: HomeAssistant, coordinator_config: ConfigType | None = None
+) -> RfScheduler:
+    """Set up the shared RF queue and its worker."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (queue := data.get(ATTR_QUEUE)) is not None:
+        return queue
 
-            code = data.get("code")
-            switcher: RfSwitcher = data.get("switcher")
+    # pylint: disable-next=import-outside-toplevel
+    from .live import async_get_live_feed, async_setup_live_feed
 
-            if switcher and code:
-                transmission_gap = switcher.transmission_gap or DEFAULT_TRANSMISSION_GAP
-                _LOGGER.info(
-                    "Transmitting RF Code: %s with Transmission Gap: %s",
-                    code,
-                    transmission_gap,
-                )
-                await hass.async_add_executor_job(switcher.send_rf_code, code)
-                await asyncio.sleep(transmission_gap)
+    coordinator = async_setup_coordinator(hass, coordinator_config)
 
-            queue.task_done()
+    def _transmission_gap(item: QueueItem) -> float:
+        switcher: RfSwitcher = item.key
+        return switcher.get_transmission_gap(item.code)
 
-    hass.async_create_background_task(async_queue_worker(), name=ATTR_QUEUE)
+    async def _async_send(item: QueueItem, bridge: str) -> None:
+        switcher: RfSwitcher = item.key
+        _LOGGER.info(
+            "Transmitting RF Code: %s on %s with Transmission Gap: %s",
+            item.code,
+            bridge,
+            _transmission_gap(item),
+        )
+        if coordinator is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from .lib.coordinator import CoordinatorUnavailable
+
+            try:
+                async with coordinator.airtime(
+                    bridge,
+                    switcher.unique_id,
+                    item.code,
+                    _transmission_gap(item),
+                    item.background,
+                ):
+                    await switcher.async_transmit(item, bridge)
+                return
+            except CoordinatorUnavailable as ex:
+                _LOGGER.warning("RF coordinator unavailable, sending anyway: %s", ex)
+        await switcher.async_transmit(item, bridge)
+
+    @callback
+    def _async_done(item: QueueItem) -> None:
+        item.key.async_transmission_done(item)
+        if item.trace is not None:
+            item.trace.mark(tracing.SPAN_GAP_END)
+            tracing.async_emit_trace(hass, item.trace, item.key.unique_id, item.code)
+
+    queue = data[ATTR_QUEUE] = RfScheduler(
+        _async_send,
+        _transmission_gap,
+        _async_done,
+        failover_cooldown=BRIDGE_FAILOVER_COOLDOWN,
+        observer=async_get_live_feed(hass).async_queue_event,
+    )
+    hass.async_create_background_task(queue.run(), name=ATTR_QUEUE)
+    async_setup_resync(hass, queue)
+    async_setup_live_feed(hass, queue)
+
+    async def _async_drain_queue(event: Event) -> None:
+        if dropped := await queue.drain(SHUTDOWN_DRAIN_TIMEOUT):
+            _LOGGER.warning(
+                "Dropped %s RF codes still queued at shutdown", len(dropped)
+            )
 
-    return True
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_drain_queue)
+
+    return queue
+
+
+@callback
+def async_setup_coordinator(
+    hass: HomeAssistant, config: ConfigType | None
+) -> "CoordinatorClient | None":
+    """Set up client of the cross-process coordinator, hosting it if asked."""
+    if config is None:
+        return None
+
+    # pylint: disable-next=import-outside-toplevel
+    from .lib.coordinator import CoordinatorClient, CoordinatorServer
+
+    if config[CONF_SERVE]:
+        server = CoordinatorServer(config[CONF_SOCKET])
+        hass.async_create_background_task(server.serve(), name=ATTR_COORDINATOR)
+
+    coordinator = CoordinatorClient(config[CONF_SOCKET])
+
+    @callback
+    def _async_close(event: Event) -> None:
+        coordinator.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return coordinator
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up RF Four Channel from a config entry."""
-    if DOMAIN not in hass.data:
-        hass.data.setdefault(DOMAIN, {})
-
-    queue = hass.data[DOMAIN].get(ATTR_QUEUE)
-    switcher = RfSwitcher(
-        hass,
-        helpers.generate_switcher_config(entry),
-        helpers.generate_switcher_options(entry),
-        queue,
-    )
+    from . import helpers  # pylint: disable=import-outside-toplevel
+
+    queue = async_setup_queue(hass)
+    try:
+        switcher = RfSwitcher(
+            hass,
+            helpers.generate_switcher_config(entry),
+            helpers.generate_switcher_options(entry),
+            queue,
+        )
+    except InvalidCodeError as ex:
+        raise ConfigEntryError(
+            f"Stored RF codes of {entry.title} are invalid, reconfigure it: {ex}"
+        ) from ex
 
     await switcher.async_added_to_hass()
 
@@ -160,15 +265,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update."""
+    """Handle config and options update without reloading the entry."""
+    from . import helpers  # pylint: disable=import-outside-toplevel
+
     switcher: RfSwitcher = hass.data[DOMAIN].get(entry.entry_id)
     if switcher:
-        _LOGGER.info("Updating switcher options for %s", switcher.unique_id)
+        config = helpers.generate_switcher_config(entry)
+        if SwitcherCode.from_dict(config.code).channel_count != switcher.channel_count:
+            # channel entities only change on setup
+            _LOGGER.info("Reloading switcher %s", switcher.unique_id)
+            hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+            return
+
+        _LOGGER.info("Updating switcher %s", switcher.unique_id)
+        await switcher.async_update_config(config)
         switcher.update_options(helpers.generate_switcher_options(entry))
 
 
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     """Handle removal of an entry."""
+    if not await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS):
+        return False
+
     switcher: RfSwitcher = hass.data[DOMAIN].pop(config_entry.entry_id)
     await switcher.async_will_remove_from_hass()
     return True
@@ -0,0 +1,96 @@
+"""Memory benchmark of switchers and their entities.
+
+Run it from the Home Assistant config folder with::
+
+    python -m custom_components.rf4ch.benchmark
+"""
+
+import asyncio
+import gc
+import tempfile
+import tracemalloc
+
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+
+from . import helpers
+from .button import RfButton
+from .const import GROUP_SWITCH_KEY
+from .lib.scheduler import RfScheduler
+from .lib.switcher import SwitcherAction
+from .switch import RfGroupSwitch, RfSwitch
+from .switcher import RfSwitcher
+
+MEMORY_SWITCHERS = (1000, 10000)
+MEMORY_TARGET = 4096  # in bytes per switcher with its 8 entities
+
+
+def fleet_config(switchers: int) -> list[dict]:
+    """Return configs of a fleet of four channel switchers."""
+    return [
+        {
+            "name": f"Switcher {index}",
+            "unique_id": f"switcher_{index}",
+            "service": {"id": "script.rf_send"},
+            "code": {
+                "prefix": format(index, "020b"),
+                "channel_a": "0001",
+                "channel_b": "0010",
+                "channel_c": "0100",
+                "channel_d": "1000",
+                "channel_on": "1111",
+                "channel_off": "0000",
+            },
+        }
+        for index in range(switchers)
+    ]
+
+
+def build_switcher(hass: HomeAssistant, config: dict, queue: RfScheduler) -> RfSwitcher:
+    """Create switcher with the entities its platforms attach."""
+    switcher = RfSwitcher(
+        hass,
+        helpers.generate_switcher_config(config),
+        helpers.generate_switcher_options(config),
+        queue,
+    )
+    for channel in switcher.channels:
+        switcher.attach_entity(Platform.SWITCH, channel, RfSwitch(switcher, channel))
+    switcher.attach_entity(Platform.SWITCH, GROUP_SWITCH_KEY, RfGroupSwitch(switcher))
+    for action in SwitcherAction:
+        switcher.attach_entity(Platform.BUTTON, action, RfButton(switcher, action))
+    return switcher
+
+
+async def async_bench_memory(switchers: int) -> float:
+    """Return bytes allocated per switcher and its entities."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        queue = RfScheduler(None, None)
+        configs = fleet_config(switchers)
+        # shared per bridge, not per switcher
+        build_switcher(hass, configs[0], queue)
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        fleet = [build_switcher(hass, config, queue) for config in configs]
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        del fleet
+        return allocated / switchers
+
+
+def main() -> None:
+    """Run benchmark from the command line."""
+    print(f"target: {MEMORY_TARGET} bytes per switcher")
+    for switchers in MEMORY_SWITCHERS:
+        per_switcher = asyncio.run(async_bench_memory(switchers))
+        print(f"{switchers:>6} switchers: {per_switcher:.0f} bytes per switcher")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,13 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .lib.switcher import SwitcherAction
 from .models import RfSwitcher
+from .tracing import command_trace
 
 ICON_MAP = {
     SwitcherAction.ON: "mdi:power-on",
@@ -22,6 +24,8 @@ async def async_setup_entry(
 ) -> bool:
     """Set up RF Four Channel Switch from a config entry."""
     switcher: RfSwitcher = hass.data[DOMAIN].get(entry.entry_id)
+    for action in SwitcherAction:
+        switcher.attach_entity(Platform.BUTTON, action, RfButton(switcher, action))
     entites = switcher.get_entities_for_platform(Platform.BUTTON)
 
     async_add_entities(entites)
@@ -39,27 +43,33 @@ class RfButton(ButtonEntity):
         """Initialize button."""
         self._switcher = switcher
         self._action = action
-        self._attr_name = f"{action.name}"
-        self._attr_unique_id = f"{DOMAIN}_{switcher.unique_id}_{action}"
-        self._attr_device_info = switcher.device_info
-        self._attr_available = switcher.available
-        self._attr_icon = ICON_MAP[action]
 
     @property
     def name(self) -> str:
         """Return name."""
-        return self._attr_name
+        return self._action.name
+
+    @property
+    def icon(self) -> str:
+        """Return icon."""
+        return ICON_MAP[self._action]
 
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
-        return self._attr_unique_id
+        return f"{DOMAIN}_{self._switcher.unique_id}_{self._action}"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared with the switcher."""
+        return self._switcher.device_info
 
     @property
     def available(self) -> bool:
         """Return the availability of the button."""
         return self._switcher.available
 
-    def press(self) -> None:
+    async def async_press(self) -> None:
         """Press the button."""
-        self._switcher.handle_action(self._action)
+        with command_trace(self.entity_id, self._context):
+            await self._switcher.async_handle_action(self._action)
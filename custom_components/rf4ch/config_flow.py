@@ -1,5 +1,6 @@
 """Config Flow for RF Four Channel integration."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -12,49 +13,97 @@ from homeassistant.util import slugify
 
 from .const import (
     CONF_AVAILABILITY_TEMPLATE,
+    CONF_AWAIT_TRANSMISSION,
+    CONF_BATCH_WINDOW,
+    CONF_BRIDGES,
     CONF_CODE,
+    CONF_CHANNEL_COUNT,
     CONF_CODE_A,
     CONF_CODE_B,
     CONF_CODE_C,
     CONF_CODE_D,
+    CONF_CODE_FORMAT,
     CONF_CODE_OFF,
     CONF_CODE_ON,
     CONF_CODE_PREFIX,
+    CONF_CODE_PROTOCOL,
     CONF_ID,
     CONF_NAME,
+    CONF_RECEIVE_EVENT,
+    CONF_RESYNC_INTERVAL,
     CONF_SERVICE,
     CONF_SERVICE_DATA,
     CONF_STATELESS,
+    CONF_SWITCHERS,
+    CONF_TRANSMISSION_GAP,
+    CONF_UNAVAILABLE_POLICY,
     CONF_UNIQUE_ID,
+    DEFAULT_BATCH_WINDOW,
+    DEFAULT_RESYNC_INTERVAL,
     DOMAIN,
 )
+from .helpers import normalise_config_entry, parse_switcher_table
+from .lib.encoding import DEFAULT_PROTOCOL, PROTOCOLS, CodeFormat, InvalidCodeError
+from .lib.switcher import (
+    CHANNEL_CODE_NAMES,
+    CHANNEL_OFF_CODE_NAMES,
+    CHANNEL_ON_CODE_NAMES,
+    DEFAULT_CHANNEL_COUNT,
+    MAX_CHANNEL_COUNT,
+    SwitcherCode,
+)
+from .models import UnavailablePolicy
+from .schema import SWITCHER_CONFIG_SCHEMA
 
 _LOGGER = logging.getLogger(__name__)
 
+SOURCE_BULK_IMPORT = "bulk_import"
+
+
+DEFAULT_CHANNEL_CODES = {
+    CONF_CODE_A: "0010",
+    CONF_CODE_B: "1000",
+    CONF_CODE_C: "0001",
+    CONF_CODE_D: "0100",
+}
+DEFAULT_GROUP_CODES = {CONF_CODE_ON: "1100", CONF_CODE_OFF: "0011"}
+
 
-CODE_SCHEMA = vol.Schema(
-    {
+def _create_code_schema(channel_count: int):
+    schema = {
         vol.Required(f"{CONF_CODE}_{CONF_CODE_PREFIX}"): selector.TextSelector(),
-        vol.Required(
-            f"{CONF_CODE}_{CONF_CODE_A}", default="0010"
-        ): selector.TextSelector(),
-        vol.Required(
-            f"{CONF_CODE}_{CONF_CODE_B}", default="1000"
-        ): selector.TextSelector(),
-        vol.Required(
-            f"{CONF_CODE}_{CONF_CODE_C}", default="0001"
-        ): selector.TextSelector(),
-        vol.Required(
-            f"{CONF_CODE}_{CONF_CODE_D}", default="0100"
-        ): selector.TextSelector(),
-        vol.Required(
-            f"{CONF_CODE}_{CONF_CODE_ON}", default="1100"
-        ): selector.TextSelector(),
-        vol.Required(
-            f"{CONF_CODE}_{CONF_CODE_OFF}", default="0011"
-        ): selector.TextSelector(),
     }
-)
+    for name in CHANNEL_CODE_NAMES[:channel_count]:
+        key = f"{CONF_CODE}_{name}"
+        if name in DEFAULT_CHANNEL_CODES:
+            schema[vol.Required(key, default=DEFAULT_CHANNEL_CODES[name])] = (
+                selector.TextSelector()
+            )
+        else:
+            schema[vol.Required(key)] = selector.TextSelector()
+    for names in (CHANNEL_ON_CODE_NAMES, CHANNEL_OFF_CODE_NAMES):
+        for name in names[:channel_count]:
+            schema[vol.Optional(f"{CONF_CODE}_{name}")] = selector.TextSelector()
+    for name, default in DEFAULT_GROUP_CODES.items():
+        key = f"{CONF_CODE}_{name}"
+        if channel_count == DEFAULT_CHANNEL_COUNT:
+            schema[vol.Optional(key, default=default)] = selector.TextSelector()
+        else:
+            schema[vol.Optional(key)] = selector.TextSelector()
+    schema[
+        vol.Required(f"{CONF_CODE}_{CONF_CODE_FORMAT}", default=CodeFormat.BINARY.value)
+    ] = selector.SelectSelector(
+        {
+            "options": [f.value for f in CodeFormat],
+            "mode": selector.SelectSelectorMode.DROPDOWN,
+        }
+    )
+    schema[
+        vol.Required(f"{CONF_CODE}_{CONF_CODE_PROTOCOL}", default=DEFAULT_PROTOCOL)
+    ] = selector.NumberSelector(
+        {"min": min(PROTOCOLS), "max": max(PROTOCOLS), "mode": "box"}
+    )
+    return vol.Schema(schema)
 
 
 def _create_data_schema(services: list):
@@ -64,14 +113,102 @@ def _create_data_schema(services: list):
             vol.Required(f"{CONF_SERVICE}_{CONF_ID}"): selector.SelectSelector(
                 {"options": services, "mode": selector.SelectSelectorMode.DROPDOWN}
             ),
+            vol.Optional(f"{CONF_SERVICE}_{CONF_BRIDGES}"): selector.SelectSelector(
+                {
+                    "options": services,
+                    "multiple": True,
+                    "mode": selector.SelectSelectorMode.DROPDOWN,
+                }
+            ),
             vol.Optional(
                 f"{CONF_SERVICE}_{CONF_SERVICE_DATA}"
             ): selector.ObjectSelector(),
+            vol.Optional(
+                f"{CONF_SERVICE}_{CONF_RECEIVE_EVENT}"
+            ): selector.TextSelector(),
             vol.Optional(CONF_AVAILABILITY_TEMPLATE): selector.TemplateSelector(),
+            vol.Required(
+                CONF_CHANNEL_COUNT, default=DEFAULT_CHANNEL_COUNT
+            ): selector.NumberSelector(
+                {"min": 1, "max": MAX_CHANNEL_COUNT, "mode": "box"}
+            ),
+        }
+    )
+
+
+def _create_bulk_schema(services: list):
+    return vol.Schema(
+        {
+            vol.Required(f"{CONF_SERVICE}_{CONF_ID}"): selector.SelectSelector(
+                {"options": services, "mode": selector.SelectSelectorMode.DROPDOWN}
+            ),
+            vol.Optional(f"{CONF_SERVICE}_{CONF_BRIDGES}"): selector.SelectSelector(
+                {
+                    "options": services,
+                    "multiple": True,
+                    "mode": selector.SelectSelectorMode.DROPDOWN,
+                }
+            ),
+            vol.Optional(
+                f"{CONF_SERVICE}_{CONF_SERVICE_DATA}"
+            ): selector.ObjectSelector(),
+            vol.Optional(
+                f"{CONF_SERVICE}_{CONF_RECEIVE_EVENT}"
+            ): selector.TextSelector(),
+            vol.Required(CONF_SWITCHERS): selector.TextSelector({"multiline": True}),
         }
     )
 
 
+class BulkImportError(Exception):
+    """Error in a row of a bulk import."""
+
+    def __init__(self, reason: str, row: int = 0, detail: str = "") -> None:
+        """Initialize error."""
+        super().__init__(detail)
+        self.reason = reason
+        self.row = row
+        self.detail = detail
+
+
+def _validate_bulk_rows(
+    rows: list[dict[str, Any]], service: dict, existing_ids: set[str]
+) -> list[dict[str, Any]]:
+    """Validate all rows in one pass, return entry data for each switcher."""
+    entries = []
+    seen = set(existing_ids)
+    for number, row in enumerate(rows, start=1):
+        row = dict(row)
+        if CONF_NAME not in row:
+            row[CONF_NAME] = row.get(CONF_UNIQUE_ID)
+        unique_id = slugify(str(row.pop(CONF_UNIQUE_ID, None) or row[CONF_NAME]))
+        row.pop(CONF_SERVICE, None)  # replaced by the shared bridge
+        config = {
+            CONF_NAME: row.pop(CONF_NAME),
+            CONF_SERVICE: service,
+        }
+        for key in (CONF_AVAILABILITY_TEMPLATE, CONF_TRANSMISSION_GAP):
+            if (value := row.pop(key, None)) is not None:
+                config[key] = value
+        config[CONF_CODE] = row.pop(CONF_CODE, row)
+
+        try:
+            if CONF_TRANSMISSION_GAP in config:
+                config[CONF_TRANSMISSION_GAP] = float(config[CONF_TRANSMISSION_GAP])
+            config = SWITCHER_CONFIG_SCHEMA(config)
+        except (vol.Invalid, ValueError) as ex:
+            raise BulkImportError("invalid_row", number, str(ex)) from ex
+
+        if unique_id in seen:
+            raise BulkImportError("duplicate_switcher", number, unique_id)
+        seen.add(unique_id)
+
+        data = normalise_config_entry(config)
+        data[CONF_UNIQUE_ID] = unique_id
+        entries.append(data)
+    return entries
+
+
 async def _get_service_list(hass: HomeAssistant):
     """Return list of services."""
     services_dict = hass.services.async_services()
@@ -90,6 +227,8 @@ class RfConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
     data = {}
+    _channel_count = DEFAULT_CHANNEL_COUNT
+    _services: list[str] | None = None
 
     @staticmethod
     @callback
@@ -97,15 +236,26 @@ class RfConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return OptionsFlowHandler(config_entry)
 
+    async def _async_get_services(self) -> list[str]:
+        """Return service list, built once per flow."""
+        if self._services is None:
+            self._services = await _get_service_list(self.hass)
+        return self._services
+
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle flow initiated by user."""
-        services = await _get_service_list(self.hass)
+        return self.async_show_menu(step_id="user", menu_options=["switcher", "bulk"])
+
+    async def async_step_switcher(self, user_input: dict[str, Any] | None = None):
+        """Handle setup of a single switcher."""
+        services = await self._async_get_services()
 
         if user_input is not None:
             _LOGGER.debug("step user input: %s", user_input)
 
             # reset data
             self.data = {}
+            self._channel_count = int(user_input[CONF_CHANNEL_COUNT])
 
             self.data[CONF_UNIQUE_ID] = slugify(user_input[CONF_NAME])
             self.data[CONF_NAME] = user_input[CONF_NAME]
@@ -115,6 +265,10 @@ class RfConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     f"{CONF_SERVICE}_{CONF_SERVICE_DATA}", {}
                 ),
             }
+            if bridges := user_input.get(f"{CONF_SERVICE}_{CONF_BRIDGES}"):
+                self.data[CONF_SERVICE][CONF_BRIDGES] = bridges
+            if receive_event := user_input.get(f"{CONF_SERVICE}_{CONF_RECEIVE_EVENT}"):
+                self.data[CONF_SERVICE][CONF_RECEIVE_EVENT] = receive_event
 
             if CONF_AVAILABILITY_TEMPLATE in user_input:
                 self.data[CONF_AVAILABILITY_TEMPLATE] = user_input[
@@ -124,31 +278,106 @@ class RfConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_code()
 
         return self.async_show_form(
-            step_id="user",
+            step_id="switcher",
             data_schema=_create_data_schema(services),
         )
 
+    async def async_step_bulk(self, user_input: dict[str, Any] | None = None):
+        """Handle import of many switchers sharing one bridge."""
+        errors = {}
+        placeholders = {"row": "", "detail": ""}
+
+        if user_input is not None:
+            service = {
+                CONF_ID: user_input[f"{CONF_SERVICE}_{CONF_ID}"],
+                CONF_SERVICE_DATA: user_input.get(
+                    f"{CONF_SERVICE}_{CONF_SERVICE_DATA}", {}
+                ),
+            }
+            if bridges := user_input.get(f"{CONF_SERVICE}_{CONF_BRIDGES}"):
+                service[CONF_BRIDGES] = bridges
+            if receive_event := user_input.get(f"{CONF_SERVICE}_{CONF_RECEIVE_EVENT}"):
+                service[CONF_RECEIVE_EVENT] = receive_event
+
+            existing_ids = {
+                entry.data[CONF_UNIQUE_ID] for entry in self._async_current_entries()
+            }
+            try:
+                rows = parse_switcher_table(user_input[CONF_SWITCHERS])
+                entries = _validate_bulk_rows(rows, service, existing_ids)
+            except ValueError as ex:
+                errors["base"] = "invalid_table"
+                placeholders["detail"] = str(ex)
+            except BulkImportError as ex:
+                errors["base"] = ex.reason
+                placeholders["row"] = str(ex.row)
+                placeholders["detail"] = ex.detail
+            else:
+                if not entries:
+                    errors["base"] = "invalid_table"
+                else:
+                    _LOGGER.debug("Importing %s switchers", len(entries))
+                    await asyncio.gather(
+                        *(
+                            self.hass.config_entries.flow.async_init(
+                                DOMAIN,
+                                context={"source": SOURCE_BULK_IMPORT},
+                                data=data,
+                            )
+                            for data in entries
+                        )
+                    )
+                    return self.async_abort(
+                        reason="bulk_imported",
+                        description_placeholders={"count": str(len(entries))},
+                    )
+
+        return self.async_show_form(
+            step_id="bulk",
+            data_schema=_create_bulk_schema(await self._async_get_services()),
+            errors=errors,
+            description_placeholders=placeholders,
+        )
+
     async def async_step_code(self, user_input: dict[str, Any] | None = None):
         """Handle code step."""
 
+        errors = {}
+
         if user_input is not None:
             _LOGGER.debug("step code input: %s", user_input)
 
-            self.data[CONF_CODE] = {
+            code = {
                 CONF_CODE_PREFIX: user_input.get(f"{CONF_CODE}_{CONF_CODE_PREFIX}"),
-                CONF_CODE_A: user_input[f"{CONF_CODE}_{CONF_CODE_A}"],
-                CONF_CODE_B: user_input[f"{CONF_CODE}_{CONF_CODE_B}"],
-                CONF_CODE_C: user_input[f"{CONF_CODE}_{CONF_CODE_C}"],
-                CONF_CODE_D: user_input[f"{CONF_CODE}_{CONF_CODE_D}"],
-                CONF_CODE_ON: user_input[f"{CONF_CODE}_{CONF_CODE_ON}"],
-                CONF_CODE_OFF: user_input[f"{CONF_CODE}_{CONF_CODE_OFF}"],
+                CONF_CODE_FORMAT: user_input[f"{CONF_CODE}_{CONF_CODE_FORMAT}"],
+                CONF_CODE_PROTOCOL: int(
+                    user_input[f"{CONF_CODE}_{CONF_CODE_PROTOCOL}"]
+                ),
             }
-
-            return self.async_create_entry(title=self.data[CONF_NAME], data=self.data)
+            for name in (
+                *CHANNEL_CODE_NAMES,
+                *CHANNEL_ON_CODE_NAMES,
+                *CHANNEL_OFF_CODE_NAMES,
+                CONF_CODE_ON,
+                CONF_CODE_OFF,
+            ):
+                if value := user_input.get(f"{CONF_CODE}_{name}"):
+                    code[name] = value
+
+            try:
+                SwitcherCode.from_dict(code)
+            except InvalidCodeError:
+                errors["base"] = "invalid_code"
+            else:
+                self.data[CONF_CODE] = code
+                return self.async_create_entry(
+                    title=self.data[CONF_NAME], data=self.data
+                )
 
         return self.async_show_form(
             step_id="code",
-            data_schema=CODE_SCHEMA,
+            data_schema=_create_code_schema(self._channel_count),
+            errors=errors,
         )
 
     async def async_step_import(self, config):
@@ -157,6 +386,12 @@ class RfConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(config[CONF_UNIQUE_ID])
         return self.async_create_entry(title=config[CONF_NAME], data=config)
 
+    async def async_step_bulk_import(self, config):
+        """Handle switcher of a bulk import, kept apart from YAML imports."""
+        await self.async_set_unique_id(config[CONF_UNIQUE_ID])
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=config[CONF_NAME], data=config)
+
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle options flow."""
@@ -175,6 +410,34 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 CONF_STATELESS,
                 default=self.config_entry.options.get(CONF_STATELESS, False),
             ): bool,
+            vol.Required(
+                CONF_AWAIT_TRANSMISSION,
+                default=self.config_entry.options.get(CONF_AWAIT_TRANSMISSION, False),
+            ): bool,
+            vol.Required(
+                CONF_BATCH_WINDOW,
+                default=self.config_entry.options.get(
+                    CONF_BATCH_WINDOW, DEFAULT_BATCH_WINDOW
+                ),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=1.0)),
+            vol.Required(
+                CONF_RESYNC_INTERVAL,
+                default=self.config_entry.options.get(
+                    CONF_RESYNC_INTERVAL, DEFAULT_RESYNC_INTERVAL
+                ),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Required(
+                CONF_UNAVAILABLE_POLICY,
+                default=self.config_entry.options.get(
+                    CONF_UNAVAILABLE_POLICY, UnavailablePolicy.SEND.value
+                ),
+            ): selector.SelectSelector(
+                {
+                    "options": [policy.value for policy in UnavailablePolicy],
+                    "mode": selector.SelectSelectorMode.DROPDOWN,
+                    "translation_key": CONF_UNAVAILABLE_POLICY,
+                }
+            ),
         }
 
         return self.async_show_form(step_id="init", data_schema=vol.Schema(options))
@@ -13,12 +13,19 @@ from homeassistant.const import (  # noqa: F401 # pylint: disable=unused-import
 )
 
 DOMAIN = "rf4ch"
-PLATFORMS = [Platform.BUTTON, Platform.SWITCH]
+PLATFORMS = [Platform.BUTTON, Platform.SENSOR, Platform.SWITCH]
 
 CONF_AVAILABILITY_TEMPLATE = "availability_template"
 CONF_STATELESS = "stateless"
+CONF_AWAIT_TRANSMISSION = "await_transmission"
+CONF_BATCH_WINDOW = "batch_window"
+CONF_RESYNC_INTERVAL = "resync_interval"
+CONF_UNAVAILABLE_POLICY = "unavailable_policy"
 CONF_OPTIONS = "options"
 
+CONF_CHANNEL_COUNT = "channel_count"
+CONF_SWITCHERS = "switchers"
+
 CONF_CODE_A = "channel_a"
 CONF_CODE_B = "channel_b"
 CONF_CODE_C = "channel_c"
@@ -26,14 +33,65 @@ CONF_CODE_D = "channel_d"
 CONF_CODE_ON = "channel_on"
 CONF_CODE_OFF = "channel_off"
 CONF_CODE_PREFIX = "prefix"
+CONF_CODE_FORMAT = "format"
+CONF_CODE_PROTOCOL = "protocol"
+
+CONF_BRIDGES = "bridges"
+CONF_PAYLOAD = "payload"
+CONF_RECEIVE_EVENT = "receive_event"
+
+GROUP_SWITCH_KEY = "all"
+
+CONF_COORDINATOR = "coordinator"
+CONF_SOCKET = "socket"
+CONF_SERVE = "serve"
+
+ATTR_CODE = "code"
+RECEIVE_REPEAT_WINDOW = 0.5  # in seconds, repeats of a press within are dropped
+RECEIVE_ECHO_WINDOW = 1.5  # in seconds, our own codes heard within are dropped
+ATTR_REPEAT = "repeat"
 
 CONF_TRANSMISSION_GAP = "transmission_gap"
+AIRTIME_GUARD = 0.05  # in seconds, added to the airtime of every code
+IDEMPOTENT_SEND_RETRIES = 2  # resends of on and off codes whose service call failed
+
+DEFAULT_BATCH_WINDOW = 0.0  # in seconds, 0 disables batching
+DEFAULT_RESYNC_INTERVAL = 0  # in minutes, 0 disables background resync
+RESYNC_IDLE_DELAY = 30  # in seconds
+RESYNC_CHECK_INTERVAL = 10  # in seconds
 
 SERVICE_DUMMY_RF_SEND = "dummy_rf_send"
 SERVICE_INTERNAL_STATE_ON = "internal_state_on"
 SERVICE_INTERNAL_STATE_OFF = "internal_state_off"
+SERVICE_RECORD_START = "record_start"
+SERVICE_RECORD_STOP = "record_stop"
+SERVICE_PROFILE_START = "profile_start"
+SERVICE_PROFILE_STOP = "profile_stop"
+SERVICE_SNAPSHOT_CREATE = "snapshot_create"
+SERVICE_SNAPSHOT_RESTORE = "snapshot_restore"
+
+ATTR_DURATION = "duration"
+ATTR_FILENAME = "filename"
+ATTR_PERSIST = "persist"
+DEFAULT_RECORDING_FILENAME = "rf4ch_recording.gz"
+RECORDING_FLUSH_LINES = 500
+
+EVENT_CODE_TRANSMITTED = "rf4ch_code_transmitted"
+EVENT_COMMAND_TRACE = "rf4ch_command_trace"
+TRACE_SAMPLE_RATE = 0.1  # fraction of traces fired as events
+
+STATS_WINDOW = 60  # in seconds
+STATS_UPDATE_INTERVAL = 10  # in seconds
+
+SNAPSHOT_STORAGE_KEY = "rf4ch_snapshots"
+SNAPSHOT_STORAGE_VERSION = 1
+
+WS_TYPE_SUBSCRIBE = "rf4ch/subscribe"
+LIVE_UPDATE_INTERVAL = 0.5  # in seconds
 
 MANUFACTURER = "TMLabs, Inc"
 MODEL = "Four Channel Rf Switcher"
+MODEL_N_CHANNEL = "{} Channel Rf Switcher"
+BRIDGE_MODEL = "RF Bridge"
 SW_VERSION = "1.0.0"
 HW_VERSION = "1.0.0"
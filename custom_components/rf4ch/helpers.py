@@ -1,14 +1,20 @@
 """Helpers for RF Four Channel integration."""
 
 from copy import copy
+import csv
+import io
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.yaml import parse_yaml
 
 from . import const
-from .switcher import SwitcherConfig, SwitcherOptions
+from .lib.switcher import CHANNEL_CODE_NAMES, DEFAULT_CHANNEL_COUNT
+from .models import SwitcherConfig, SwitcherOptions, UnavailablePolicy
 
 
 def normalise_config_entry(config: ConfigType) -> ConfigType:
@@ -30,6 +36,33 @@ def normalise_config_entry(config: ConfigType) -> ConfigType:
     return c
 
 
+def parse_switcher_table(text: str) -> list[dict[str, Any]]:
+    """Parse pasted CSV table or YAML list/mapping of switchers into rows.
+
+    Raises ValueError when the text is neither.
+    """
+    text = text.strip()
+    header = text.splitlines()[0] if text else ""
+    if "," in header and ":" not in header:
+        return [
+            {key.strip(): value.strip() for key, value in row.items() if value}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+
+    try:
+        rows = parse_yaml(text)
+    except HomeAssistantError as ex:
+        raise ValueError(str(ex)) from ex
+
+    # same shape as the rf4ch section of configuration.yaml
+    if isinstance(rows, dict):
+        rows = [{const.CONF_UNIQUE_ID: key, **row} for key, row in rows.items()]
+
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValueError("Expected a list of switchers")
+    return rows
+
+
 def generate_switcher_config(
     config_or_entry: ConfigType | ConfigEntry,
 ) -> SwitcherConfig:
@@ -48,7 +81,9 @@ def generate_switcher_config(
         availability_template=config.get(const.CONF_AVAILABILITY_TEMPLATE),
         transmission_gap=config.get(const.CONF_TRANSMISSION_GAP, None),
         device_info=get_device_info(
-            config[const.CONF_UNIQUE_ID], config[const.CONF_NAME]
+            config[const.CONF_UNIQUE_ID],
+            config[const.CONF_NAME],
+            sum(1 for name in CHANNEL_CODE_NAMES if name in config[const.CONF_CODE]),
         ),
     )
 
@@ -66,15 +101,29 @@ def generate_switcher_options(
 
     return SwitcherOptions(
         stateless=options.get(const.CONF_STATELESS, False),
+        await_transmission=options.get(const.CONF_AWAIT_TRANSMISSION, False),
+        batch_window=options.get(const.CONF_BATCH_WINDOW, const.DEFAULT_BATCH_WINDOW),
+        resync_interval=options.get(
+            const.CONF_RESYNC_INTERVAL, const.DEFAULT_RESYNC_INTERVAL
+        ),
+        unavailable_policy=UnavailablePolicy(
+            options.get(const.CONF_UNAVAILABLE_POLICY, UnavailablePolicy.SEND)
+        ),
     )
 
 
-def get_device_info(uid: str, name: str) -> DeviceInfo:
+def get_device_info(
+    uid: str, name: str, channel_count: int = DEFAULT_CHANNEL_COUNT
+) -> DeviceInfo:
     """Get device info."""
     return DeviceInfo(
         identifiers={(const.DOMAIN, uid)},
         manufacturer=const.MANUFACTURER,
-        model=const.MODEL,
+        model=(
+            const.MODEL
+            if channel_count == DEFAULT_CHANNEL_COUNT
+            else const.MODEL_N_CHANNEL.format(channel_count)
+        ),
         name=name,
         sw_version=const.SW_VERSION,
         hw_version=const.HW_VERSION,
@@ -1 +1,5 @@
-"""Internal modules for RF Four Channel integration."""
+"""Internal modules for RF Four Channel integration.
+
+Only the standard library may be imported here, the package is usable
+without Home Assistant, e.g. by the replay tool.
+"""
@@ -0,0 +1,204 @@
+"""Benchmarks of the Home Assistant free core of RF Four Channel Switcher.
+
+Run them from the integration folder with::
+
+    cd custom_components/rf4ch
+    python -m lib.benchmark receive
+    python -m lib.benchmark filter
+    python -m lib.benchmark imports
+"""
+
+from pathlib import Path
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from .receiver import CodeIndex, ReceiveFilter, normalise_code
+from .switcher import SwitcherCode
+
+REPEAT = 5  # runs per measurement, the best one counts
+
+RECEIVE_SWITCHERS = (10, 1000, 10000)
+RECEIVE_EVENTS = 200_000
+RECEIVE_TARGET = 10e-6  # in seconds per received code, at any fleet size
+
+FILTER_EVENTS = 200_000
+FILTER_INTERVAL = 0.001  # in seconds between received codes, a busy bridge
+FILTER_TARGET = 5e-6  # in seconds per received code, whatever the traffic
+# received codes after which the memory held by the filter is compared
+FILTER_MEMORY_EVENTS = (10_000, 200_000)
+
+INTEGRATION_DIR = Path(__file__).parents[1]
+# module, folder it is imported from, prefix of the modules it owns
+IMPORT_MODULES = (
+    ("lib.switcher", INTEGRATION_DIR, "lib"),
+    ("custom_components.rf4ch", INTEGRATION_DIR.parents[1], "custom_components.rf4ch"),
+)
+IMPORT_TARGET = 20e-3  # in seconds spent in modules of this integration
+
+
+def fleet_codes(switchers: int) -> list[dict[str, str]]:
+    """Return encoded codes by name of a fleet, prefixes unique per switcher."""
+    return [
+        dict(
+            SwitcherCode.from_dict(
+                {
+                    "prefix": format(index, "020b"),
+                    "channel_a": "0001",
+                    "channel_b": "0010",
+                    "channel_c": "0100",
+                    "channel_d": "1000",
+                    "channel_on": "1111",
+                    "channel_off": "0000",
+                }
+            ).items()
+        )
+        for index in range(switchers)
+    ]
+
+
+def bench_receive(switchers: int, events: int = RECEIVE_EVENTS) -> float:
+    """Return best seconds per received code from event payload to switcher.
+
+    Codes arrive 10 ms apart, so the receive filter passes most of them.
+    """
+    index: CodeIndex[int] = CodeIndex()
+    codes = fleet_codes(switchers)
+    for target, named in enumerate(codes):
+        index.add(target, named)
+    received = [
+        code
+        for named in random.Random(switchers).choices(codes, k=1000)
+        for code in named.values()
+    ]
+
+    def _run() -> float:
+        receive_filter = ReceiveFilter()
+        started = time.perf_counter()
+        for number in range(events):
+            key = normalise_code(received[number % len(received)])
+            if index.lookup(key) is not None:
+                receive_filter.accept(key, number * 0.01)
+        return (time.perf_counter() - started) / events
+
+    return min(_run() for _ in range(REPEAT))
+
+
+def filter_traffic(kind: str, events: int) -> tuple[ReceiveFilter, list[str]]:
+    """Return filter and received codes of a kind of traffic.
+
+    Repeats are one held button, echoes are codes we sent coming back and
+    noise is a stream of random codes that never repeat.
+    """
+    receive_filter = ReceiveFilter()
+    rng = random.Random(events)
+    if kind == "repeats":
+        return receive_filter, [format(rng.getrandbits(24), "024b")] * events
+    if kind == "echoes":
+        codes = [format(rng.getrandbits(24), "024b") for _ in range(10)]
+        for code in codes:
+            receive_filter.sent(code, 0.0)
+        return receive_filter, [codes[number % 10] for number in range(events)]
+    return receive_filter, [format(rng.getrandbits(24), "024b") for _ in range(events)]
+
+
+def bench_filter(kind: str, events: int = FILTER_EVENTS) -> float:
+    """Return best seconds per received code passed through the filter."""
+
+    def _run() -> float:
+        receive_filter, received = filter_traffic(kind, events)
+        started = time.perf_counter()
+        for number, key in enumerate(received):
+            receive_filter.accept(key, number * FILTER_INTERVAL)
+        return (time.perf_counter() - started) / events
+
+    return min(_run() for _ in range(REPEAT))
+
+
+def filter_memory(events: int) -> int:
+    """Return bytes held by the filter after receiving events of noise."""
+    receive_filter, received = filter_traffic("noise", events)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for number, key in enumerate(received):
+        receive_filter.accept(key, number * FILTER_INTERVAL)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def bench_import(module: str, cwd: Path, own: str) -> tuple[float, float, int] | None:
+    """Return total and own import time and own module count of module.
+
+    Every run uses a fresh interpreter, the one with least own time counts.
+
+    Returns None when the module can't be imported, e.g. without Home
+    Assistant installed.
+    """
+    best: tuple[float, float, int] | None = None
+    for _ in range(REPEAT):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode:
+            return None
+        total = own_time = 0.0
+        own_count = 0
+        # import time: <self us> | <cumulative us> | <module>
+        for line in result.stderr.splitlines()[1:]:
+            self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+            name = name.strip()
+            if name == own or name.startswith(f"{own}."):
+                own_time += int(self_us) / 1e6
+                own_count += 1
+            if name == module:
+                total = int(cumulative_us) / 1e6
+        if best is None or own_time < best[1]:
+            best = (total, own_time, own_count)
+    return best
+
+
+def main() -> None:
+    """Run benchmarks from the command line."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description="Benchmark the RF core.")
+    parser.add_argument("benchmark", choices=["receive", "filter", "imports"])
+    args = parser.parse_args()
+
+    if args.benchmark == "receive":
+        print(f"target: {RECEIVE_TARGET * 1e6:.1f} us per received code")
+        for switchers in RECEIVE_SWITCHERS:
+            per_event = bench_receive(switchers)
+            print(f"{switchers:>6} switchers: {per_event * 1e6:.2f} us per code")
+
+    if args.benchmark == "filter":
+        print(f"target: {FILTER_TARGET * 1e6:.1f} us per received code")
+        for kind in ("repeats", "echoes", "noise"):
+            per_event = bench_filter(kind)
+            print(f"{kind:>7}: {per_event * 1e6:.2f} us per code")
+        for events in FILTER_MEMORY_EVENTS:
+            held = filter_memory(events)
+            print(f"{events:>9} noise codes: {held / 1024:.1f} kB held by the filter")
+
+    if args.benchmark == "imports":
+        print(f"target: {IMPORT_TARGET * 1e3:.0f} ms in own modules")
+        for module, cwd, own in IMPORT_MODULES:
+            if (times := bench_import(module, cwd, own)) is None:
+                print(f"{module}: can't be imported by {sys.executable}")
+                continue
+            total, own_time, own_count = times
+            print(
+                f"{module}: {total * 1e3:.1f} ms total, "
+                f"{own_time * 1e3:.1f} ms in {own_count} own modules"
+            )
+
+
+if __name__ == "__main__":
+    main()
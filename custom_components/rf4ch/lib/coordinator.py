@@ -0,0 +1,275 @@
+"""Share RF bridge airtime between processes over a Unix socket.
+
+One process hosts the coordinator, an RfScheduler handing out airtime per
+bridge. Clients ask for a slot before sending a code and report back once
+it is sent, the bridge then stays reserved for the gap of the code.
+Background requests, e.g. resyncs, only get airtime while no interactive
+request of any client is waiting. Messages are JSON lines::
+
+    -> {"id": 1, "bridge": "script.rf_send", "key": "kitchen",
+        "code": "...", "gap": 0.3, "priority": "interactive"}
+    <- {"id": 1, "grant": true}
+    -> {"id": 1, "sent": true}
+
+Run a stand-in coordinator, or simulate clients sharing a fake bridge,
+with::
+
+    cd custom_components/rf4ch
+    python -m lib.coordinator /tmp/rf4ch.sock
+    python -m lib.coordinator /tmp/rf4ch.sock --simulate 3
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass, field
+import itertools
+import json
+import logging
+import os
+import time
+
+from .scheduler import QueueItem, RfScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+SENT_TIMEOUT = 10.0  # in seconds, a granted bridge is freed after this
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+
+class CoordinatorUnavailable(Exception):
+    """Coordinator could not be reached or went away before granting."""
+
+
+@dataclass(slots=True)
+class AirtimeRequest:
+    """Airtime asked for by a client."""
+
+    id: int
+    gap: float
+    writer: asyncio.StreamWriter
+    sent: asyncio.Future = field(
+        default_factory=lambda: asyncio.get_running_loop().create_future()
+    )
+    granted: bool = False
+
+
+class CoordinatorServer:
+    """Grant bridge airtime to clients, one code per bridge at a time."""
+
+    def __init__(self, path: str, sent_timeout: float = SENT_TIMEOUT) -> None:
+        """Initialize server."""
+        self.path = path
+        self._sent_timeout = sent_timeout
+        self._scheduler = RfScheduler(self._async_grant, self._gap)
+        self._connections = itertools.count(1)
+
+    @staticmethod
+    def _gap(item: QueueItem) -> float:
+        """Return gap of granted request, cancelled ones need none."""
+        request: AirtimeRequest = item.trace
+        return request.gap if request.granted else 0.0
+
+    async def _async_grant(self, item: QueueItem, bridge: Hashable) -> None:
+        """Grant airtime and hold the bridge until the code is sent."""
+        request: AirtimeRequest = item.trace
+        if request.sent.done() or request.writer.is_closing():
+            return
+        request.granted = True
+        request.writer.write(_encode({"id": request.id, "grant": True}))
+        try:
+            async with asyncio.timeout(self._sent_timeout):
+                await request.sent
+        except TimeoutError:
+            _LOGGER.warning("No report for code sent on %s, freeing bridge", bridge)
+
+    async def _async_handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests of one client."""
+        connection = next(self._connections)
+        requests: dict[int, AirtimeRequest] = {}
+        keys: set[Hashable] = set()
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                if message.get("sent"):
+                    request = requests.pop(message["id"], None)
+                    if request is not None and not request.sent.done():
+                        request.sent.set_result(None)
+                    continue
+
+                request = requests[message["id"]] = AirtimeRequest(
+                    message["id"], float(message.get("gap", 0.0)), writer
+                )
+                key = (connection, message.get("key"))
+                keys.add(key)
+                item = QueueItem(
+                    key, message["code"], trace=request, bridges=(message["bridge"],)
+                )
+                if message.get("priority") == PRIORITY_BACKGROUND:
+                    # a client waits for its grant, one request per key at a time
+                    self._scheduler.put_background(
+                        key, lambda item=item: [item], item.bridges
+                    )
+                else:
+                    self._scheduler.put(item)
+        except (ConnectionError, ValueError, KeyError) as ex:
+            _LOGGER.warning("Dropping coordinator client %s: %s", connection, ex)
+        finally:
+            for key in keys:
+                self._scheduler.drop(key)
+            for request in requests.values():
+                if not request.sent.done():
+                    request.sent.set_result(None)
+            writer.close()
+
+    async def serve(self) -> None:
+        """Serve clients on the socket until cancelled."""
+        server = await asyncio.start_unix_server(self._async_handle, path=self.path)
+        _LOGGER.info("RF coordinator listening on %s", self.path)
+        try:
+            async with server:
+                await self._scheduler.run()
+        finally:
+            with suppress(FileNotFoundError):
+                os.unlink(self.path)
+
+
+class CoordinatorClient:
+    """Ask a coordinator for airtime before sending codes."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize client."""
+        self.path = path
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader: asyncio.Task | None = None
+        self._waiters: dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._lock = asyncio.Lock()
+
+    async def _async_connect(self) -> asyncio.StreamWriter:
+        """Return connection to coordinator, connecting once."""
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                try:
+                    reader, self._writer = await asyncio.open_unix_connection(self.path)
+                except OSError as ex:
+                    raise CoordinatorUnavailable(str(ex)) from ex
+                self._reader = asyncio.get_running_loop().create_task(
+                    self._async_read(reader)
+                )
+            return self._writer
+
+    async def _async_read(self, reader: asyncio.StreamReader) -> None:
+        """Resolve waiters as grants come in."""
+        try:
+            while line := await reader.readline():
+                message = json.loads(line)
+                if (waiter := self._waiters.pop(message["id"], None)) is not None:
+                    if not waiter.done():
+                        waiter.set_result(None)
+        except (ConnectionError, ValueError, KeyError) as ex:
+            _LOGGER.debug("Coordinator connection lost: %s", ex)
+        finally:
+            if self._writer is not None:
+                self._writer.close()
+            waiters, self._waiters = self._waiters, {}
+            for waiter in waiters.values():
+                if not waiter.done():
+                    waiter.set_exception(CoordinatorUnavailable("connection lost"))
+
+    @asynccontextmanager
+    async def airtime(
+        self, bridge: str, key: str, code: str, gap: float, background: bool = False
+    ) -> AsyncIterator[None]:
+        """Hold airtime of bridge while the body sends code."""
+        writer = await self._async_connect()
+        request_id = next(self._ids)
+        waiter = self._waiters[request_id] = asyncio.get_running_loop().create_future()
+        message = {"id": request_id, "bridge": bridge, "key": key, "code": code}
+        priority = PRIORITY_BACKGROUND if background else PRIORITY_INTERACTIVE
+        writer.write(_encode({**message, "gap": gap, "priority": priority}))
+        try:
+            await waiter
+            yield
+        finally:
+            self._waiters.pop(request_id, None)
+            if not writer.is_closing():
+                writer.write(_encode({"id": request_id, "sent": True}))
+
+    def close(self) -> None:
+        """Close connection to coordinator."""
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
+        if self._writer is not None:
+            self._writer.close()
+
+
+def _encode(message: dict) -> bytes:
+    """Return message as JSON line."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+async def async_simulate(
+    path: str, clients: int, codes: int, gap: float, send_duration: float
+) -> list[tuple[float, float]]:
+    """Let clients share a fake bridge, return on-air intervals in send order."""
+    on_air: list[tuple[float, float]] = []
+
+    async def _client(index: int) -> None:
+        client = CoordinatorClient(path)
+        for number in range(codes):
+            async with client.airtime("fake_bridge", f"client_{index}", "1", gap):
+                start = time.monotonic()
+                await asyncio.sleep(send_duration)
+                on_air.append((start, time.monotonic()))
+            await asyncio.sleep(0)
+        client.close()
+
+    await asyncio.gather(*(_client(index) for index in range(clients)))
+    return on_air
+
+
+def main() -> None:
+    """Run a stand-in coordinator from the command line."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description="Share RF bridges between hosts.")
+    parser.add_argument("socket")
+    parser.add_argument(
+        "--simulate", type=int, metavar="CLIENTS", help="run fake clients and exit"
+    )
+    parser.add_argument("--codes", type=int, default=10, help="codes per client")
+    parser.add_argument("--gap", type=float, default=0.1)
+    parser.add_argument("--send-duration", type=float, default=0.05)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    async def _run() -> None:
+        server = asyncio.create_task(CoordinatorServer(args.socket).serve())
+        if args.simulate is None:
+            await server
+            return
+
+        await asyncio.sleep(0.1)
+        on_air = await async_simulate(
+            args.socket, args.simulate, args.codes, args.gap, args.send_duration
+        )
+        server.cancel()
+        on_air.sort()
+        spacing = [start - end for (_, end), (start, _) in itertools.pairwise(on_air)]
+        print(f"codes sent:  {len(on_air)}")
+        print(f"overlaps:    {sum(1 for value in spacing if value < 0)}")
+        if spacing:
+            print(f"min spacing: {min(spacing) * 1000:.0f} ms")
+
+    with suppress(KeyboardInterrupt):
+        asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
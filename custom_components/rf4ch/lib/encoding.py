@@ -0,0 +1,118 @@
+"""RF code encoding for RF Four Channel Switcher."""
+
+from dataclasses import dataclass
+from enum import StrEnum
+from functools import lru_cache
+
+DEFAULT_PROTOCOL = 1
+
+
+class InvalidCodeError(ValueError):
+    """Raised when a code can not be encoded."""
+
+
+class CodeFormat(StrEnum):
+    """Enum for code notations."""
+
+    BINARY = "binary"
+    HEX = "hex"
+    TRISTATE = "tristate"
+
+
+class PayloadType(StrEnum):
+    """Enum for payloads understood by RF bridges."""
+
+    RC_SWITCH = "rc_switch"  # bit string, e.g. transmit_rc_switch_raw
+    RAW = "raw"  # signed pulse timings in microseconds, e.g. transmit_raw
+
+
+@dataclass(frozen=True, slots=True)
+class RcProtocol:
+    """Pulse timings of an rc-switch protocol, in multiples of pulse length."""
+
+    pulse_length: int
+    sync: tuple[int, int]
+    zero: tuple[int, int]
+    one: tuple[int, int]
+    inverted: bool = False
+
+
+PROTOCOLS: dict[int, RcProtocol] = {
+    1: RcProtocol(350, (1, 31), (1, 3), (3, 1)),
+    2: RcProtocol(650, (1, 10), (1, 2), (2, 1)),
+    3: RcProtocol(100, (30, 71), (4, 11), (9, 6)),
+    4: RcProtocol(380, (1, 6), (1, 3), (3, 1)),
+    5: RcProtocol(500, (6, 14), (1, 2), (2, 1)),
+    6: RcProtocol(450, (23, 1), (1, 2), (2, 1), inverted=True),
+    7: RcProtocol(150, (2, 62), (1, 6), (6, 1)),
+}
+
+_TRISTATE_BITS = {"0": "00", "1": "11", "F": "01"}
+
+
+@lru_cache(maxsize=None)
+def encode_bits(code: str, code_format: CodeFormat = CodeFormat.BINARY) -> str:
+    """Encode code in given notation into a bit string."""
+    code = code.strip()
+    if not code:
+        raise InvalidCodeError("Empty code")
+
+    if code_format == CodeFormat.BINARY:
+        if not set(code) <= {"0", "1"}:
+            raise InvalidCodeError(f"Invalid binary code: {code!r}")
+        return code
+
+    if code_format == CodeFormat.HEX:
+        digits = code[2:] if code.lower().startswith("0x") else code
+        try:
+            value = int(digits, 16)
+        except ValueError as ex:
+            raise InvalidCodeError(f"Invalid hex code: {code!r}") from ex
+        return format(value, f"0{len(digits) * 4}b")
+
+    if code_format == CodeFormat.TRISTATE:
+        try:
+            return "".join(_TRISTATE_BITS[ch] for ch in code.upper())
+        except KeyError as ex:
+            raise InvalidCodeError(f"Invalid tri-state code: {code!r}") from ex
+
+    raise InvalidCodeError(f"Unknown code format: {code_format!r}")
+
+
+@lru_cache(maxsize=None)
+def encode_pulses(bits: str, protocol: int = DEFAULT_PROTOCOL) -> tuple[int, ...]:
+    """Encode bit string into signed pulse timings in microseconds."""
+    if (p := PROTOCOLS.get(protocol)) is None:
+        raise InvalidCodeError(f"Unknown protocol: {protocol!r}")
+
+    mark, space = (-1, 1) if p.inverted else (1, -1)
+
+    def _pulse(high_low: tuple[int, int]) -> tuple[int, int]:
+        high, low = high_low
+        return mark * high * p.pulse_length, space * low * p.pulse_length
+
+    zero, one = _pulse(p.zero), _pulse(p.one)
+    timings: list[int] = []
+    for bit in bits:
+        timings.extend(one if bit == "1" else zero)
+    timings.extend(_pulse(p.sync))
+
+    return tuple(timings)
+
+
+@lru_cache(maxsize=None)
+def code_airtime(bits: str, protocol: int = DEFAULT_PROTOCOL, repeat: int = 1) -> float:
+    """Return seconds a bit string is on air when sent repeat times."""
+    pulses = encode_pulses(bits, protocol)
+    return sum(abs(pulse) for pulse in pulses) * max(repeat, 1) / 1_000_000
+
+
+def encode_payload(
+    bits: str,
+    payload_type: PayloadType = PayloadType.RC_SWITCH,
+    protocol: int = DEFAULT_PROTOCOL,
+) -> str | list[int]:
+    """Encode bit string into payload for bridge."""
+    if payload_type == PayloadType.RAW:
+        return list(encode_pulses(bits, protocol))
+    return bits
@@ -0,0 +1,149 @@
+"""Received RF code lookup for RF Four Channel Switcher."""
+
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+DEFAULT_REPEAT_WINDOW = 0.5  # in seconds
+DEFAULT_ECHO_WINDOW = 1.5  # in seconds
+DEFAULT_BUCKETS = 8
+DEFAULT_BUCKET_SIZE = 64
+
+_BITS = frozenset("01")
+
+
+def normalise_code(code: str | int) -> str | None:
+    """Return bit string key for a received bit string or integer code.
+
+    Leading zeros are kept, integers can't carry them.
+    """
+    if isinstance(code, int):
+        return format(code, "b") if code >= 0 else None
+    try:
+        code = code.strip()
+    except AttributeError:
+        return None
+    if not code or not set(code) <= _BITS:
+        return None
+    return code
+
+
+class CodeIndex(Generic[T]):
+    """Hash index from full RF code to (target, code name).
+
+    A code shared by two targets is routed to the one added last, the
+    other one takes over again once that one is removed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize code index."""
+        self._index: dict[str, tuple[T, str]] = {}
+        self._shadowed: dict[str, list[tuple[T, str]]] = {}
+        self._keys: dict[T, list[str]] = {}
+
+    def __len__(self) -> int:
+        """Return number of indexed codes."""
+        return len(self._index)
+
+    def add(self, target: T, codes: dict[str, str]) -> list[T]:
+        """Index codes of target by name, return targets whose codes clash."""
+        clashes = []
+        keys = self._keys.setdefault(target, [])
+        for name, code in codes.items():
+            if (key := normalise_code(code)) is None:
+                continue
+            if (existing := self._index.get(key)) is not None and existing[0] != target:
+                clashes.append(existing[0])
+                self._shadowed.setdefault(key, []).append(existing)
+            self._index[key] = (target, name)
+            keys.append(key)
+        return clashes
+
+    def remove(self, target: T) -> None:
+        """Remove all codes of target, handing shared codes back."""
+        for key in self._keys.pop(target, ()):
+            shadowed = [
+                entry for entry in self._shadowed.pop(key, ()) if entry[0] != target
+            ]
+            if (entry := self._index.get(key)) is not None and entry[0] == target:
+                if shadowed:
+                    self._index[key] = shadowed.pop()
+                else:
+                    del self._index[key]
+            if shadowed:
+                self._shadowed[key] = shadowed
+
+    def lookup(self, code: str | int) -> tuple[T, str] | None:
+        """Return (target, code name) for received code."""
+        if (key := normalise_code(code)) is None:
+            return None
+        return self._index.get(key)
+
+
+class RecentCodes:
+    """Codes seen within a time window, kept in a ring of time buckets.
+
+    Memory and lookup cost are bounded by the number and size of buckets,
+    however many codes come in. Codes arriving at a full bucket are not
+    remembered.
+    """
+
+    def __init__(
+        self,
+        window: float,
+        buckets: int = DEFAULT_BUCKETS,
+        bucket_size: int = DEFAULT_BUCKET_SIZE,
+    ) -> None:
+        """Initialize ring."""
+        self._width = window / buckets
+        self._bucket_size = bucket_size
+        self._buckets: list[set[str]] = [set() for _ in range(buckets)]
+        self._slots: list[int] = [-1] * buckets
+
+    def add(self, key: str, now: float) -> None:
+        """Remember key as seen at now."""
+        slot = int(now // self._width)
+        index = slot % len(self._buckets)
+        bucket = self._buckets[index]
+        if self._slots[index] != slot:
+            self._slots[index] = slot
+            bucket.clear()
+        if len(bucket) < self._bucket_size:
+            bucket.add(key)
+
+    def seen(self, key: str, now: float) -> bool:
+        """Return True when key was seen within the window before now."""
+        oldest = int(now // self._width) - len(self._buckets) + 1
+        for slot, bucket in zip(self._slots, self._buckets):
+            if slot >= oldest and key in bucket:
+                return True
+        return False
+
+
+class ReceiveFilter:
+    """Drop repeats of received codes and echoes of codes we sent."""
+
+    def __init__(
+        self,
+        repeat_window: float = DEFAULT_REPEAT_WINDOW,
+        echo_window: float = DEFAULT_ECHO_WINDOW,
+    ) -> None:
+        """Initialize filter."""
+        self._received = RecentCodes(repeat_window)
+        self._sent = RecentCodes(echo_window)
+
+    def sent(self, key: str, now: float) -> None:
+        """Remember code sent by us, its echo is dropped."""
+        self._sent.add(key, now)
+
+    def accept(self, key: str, now: float) -> bool:
+        """Return True for a fresh press, False for repeats and echoes.
+
+        Repeats keep the window open, so a held button counts once.
+        """
+        if self._sent.seen(key, now):
+            return False
+        repeat = self._received.seen(key, now)
+        self._received.add(key, now)
+        return not repeat
@@ -0,0 +1,263 @@
+"""Record and replay RF traffic for RF Four Channel Switcher.
+
+Recordings are gzipped text, one line per queued code:
+``<ms since previous code> <switcher> <label> <code> <gap>``.
+
+Replay a recording against a fake bridge on a virtual clock with::
+
+    cd custom_components/rf4ch
+    python -m lib.replay recording.gz --gap 0.25 --batch-window 0.05
+"""
+
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import gzip
+import time
+
+from .scheduler import QueueItem, RfScheduler
+
+RECORDING_HEADER = "#rf4ch-recording 1"
+GROUP_LABELS = ("channel_on", "channel_off")
+DEFAULT_GAP = 0.25  # in seconds
+DEFAULT_SEND_DURATION = 0.05  # in seconds
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedCode:
+    """Code queued by a switcher."""
+
+    at: float
+    switcher: str
+    label: str
+    code: str
+    gap: float | None
+
+
+class Recorder:
+    """Collect queued codes as recording lines."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize recorder."""
+        self._clock = clock
+        self._last = clock()
+        self._lines: list[str] = [RECORDING_HEADER]
+        self.recorded = 0
+
+    def record(
+        self, switcher: str, label: str | None, code: str, gap: float | None
+    ) -> None:
+        """Record code queued by switcher."""
+        now = self._clock()
+        delta = round((now - self._last) * 1000)
+        self._last = now
+        self._lines.append(
+            f"{delta} {switcher} {label or '-'} {code} {'-' if gap is None else gap}"
+        )
+        self.recorded += 1
+
+    def __len__(self) -> int:
+        """Return number of lines not taken yet."""
+        return len(self._lines)
+
+    def take(self) -> list[str]:
+        """Return and forget lines recorded so far."""
+        lines, self._lines = self._lines, []
+        return lines
+
+
+def write_recording(path: str, lines: Iterable[str], append: bool = True) -> None:
+    """Write recording lines to gzipped file, this does blocking I/O."""
+    with gzip.open(path, "at" if append else "wt", encoding="utf-8") as file:
+        for line in lines:
+            file.write(line + "\n")
+
+
+def load_recording(path: str) -> list[RecordedCode]:
+    """Load recording, offsets are turned into seconds since start."""
+    records = []
+    at = 0.0
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        for line in file:
+            if not line.strip() or line.startswith("#"):
+                continue
+            delta, switcher, label, code, gap = line.split()
+            at += int(delta) / 1000
+            records.append(
+                RecordedCode(
+                    at, switcher, label, code, None if gap == "-" else float(gap)
+                )
+            )
+    return records
+
+
+def batch_records(records: list[RecordedCode], window: float) -> list[RecordedCode]:
+    """Merge codes of a switcher queued within window of the first one.
+
+    Repeated channel toggles cancel out and group codes supersede toggles
+    queued before them in the same window.
+    """
+    if window <= 0:
+        return records
+
+    merged: list[RecordedCode] = []
+    open_batches: dict[str, tuple[float, list[RecordedCode]]] = {}
+
+    def _close(switcher: str) -> None:
+        merged.extend(open_batches.pop(switcher)[1])
+
+    for record in records:
+        for switcher in [
+            s for s, (start, _) in open_batches.items() if record.at - start > window
+        ]:
+            _close(switcher)
+
+        _, batch = open_batches.setdefault(record.switcher, (record.at, []))
+        if record.label in GROUP_LABELS:
+            batch.clear()
+            batch.append(record)
+        elif (
+            match := next((r for r in batch if r.code == record.code), None)
+        ) is not None:
+            batch.remove(match)
+        else:
+            batch.append(record)
+
+    for switcher in list(open_batches):
+        _close(switcher)
+
+    merged.sort(key=lambda record: record.at)
+    return merged
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayResult:
+    """Outcome of a replay."""
+
+    recorded: int
+    sent: int
+    airtime: float
+    duration: float
+    latencies: list[float]
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return latency percentile in seconds."""
+        if not self.latencies:
+            return None
+        index = min(len(self.latencies) - 1, int(fraction * len(self.latencies)))
+        return self.latencies[index]
+
+
+class VirtualClock:
+    """Clock advanced by the replay instead of real time."""
+
+    def __init__(self) -> None:
+        """Initialize clock."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return current virtual time."""
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        """Advance clock instead of sleeping."""
+        self.now += delay
+
+
+async def async_replay(
+    records: list[RecordedCode],
+    gap: float | None = None,
+    send_duration: float = DEFAULT_SEND_DURATION,
+    batch_window: float = 0.0,
+    fair: bool = True,
+) -> ReplayResult:
+    """Replay records through the scheduler against a fake bridge.
+
+    A fixed gap overrides recorded gaps, fair=False serves codes in
+    arrival order instead of round robin between switchers.
+    """
+    clock = VirtualClock()
+    latencies: list[float] = []
+    airtime = 0.0
+
+    def _gap(item: QueueItem) -> float:
+        if gap is not None:
+            return gap
+        return item.trace.gap if item.trace.gap is not None else DEFAULT_GAP
+
+    async def _send(item: QueueItem, bridge: str | None) -> None:
+        clock.now += send_duration
+        latencies.append(clock.now - item.queued_at)
+
+    def _done(item: QueueItem) -> None:
+        nonlocal airtime
+        airtime += send_duration + _gap(item)
+
+    scheduler = RfScheduler(_send, _gap, _done, clock=clock, sleep=clock.sleep)
+    pending = batch_records(records, batch_window)
+
+    index = 0
+    while index < len(pending) or len(scheduler):
+        while index < len(pending) and pending[index].at <= clock.now:
+            record = pending[index]
+            # the record rides along as trace to look up its gap
+            item = QueueItem(
+                record.switcher if fair else None, record.code, trace=record
+            )
+            scheduler.put(item)
+            item.queued_at = record.at
+            index += 1
+
+        if (item := scheduler.pop()) is None:
+            clock.now = pending[index].at
+            continue
+        await scheduler.transmit(item)
+
+    latencies.sort()
+    return ReplayResult(
+        recorded=len(records),
+        sent=len(latencies),
+        airtime=airtime,
+        duration=clock.now - (records[0].at if records else 0.0),
+        latencies=latencies,
+    )
+
+
+def main() -> None:
+    """Replay recording from the command line."""
+    import argparse  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(description="Replay recorded RF traffic.")
+    parser.add_argument("recording")
+    parser.add_argument("--gap", type=float, help="override recorded gaps")
+    parser.add_argument("--send-duration", type=float, default=DEFAULT_SEND_DURATION)
+    parser.add_argument("--batch-window", type=float, default=0.0)
+    parser.add_argument(
+        "--fifo", action="store_true", help="arrival order instead of round robin"
+    )
+    args = parser.parse_args()
+
+    records = load_recording(args.recording)
+    started = time.monotonic()
+    result = asyncio.run(
+        async_replay(
+            records,
+            gap=args.gap,
+            send_duration=args.send_duration,
+            batch_window=args.batch_window,
+            fair=not args.fifo,
+        )
+    )
+    elapsed = time.monotonic() - started
+
+    print(f"codes recorded: {result.recorded}")
+    print(f"codes sent:     {result.sent}")
+    print(f"airtime:        {result.airtime:.1f} s of {result.duration:.1f} s")
+    for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        if (value := result.percentile(fraction)) is not None:
+            print(f"latency {name}:    {value * 1000:.0f} ms")
+    print(f"replayed in:    {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""RF transmission scheduler for RF Four Channel Switcher."""
+
+import asyncio
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from enum import StrEnum
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FAILOVER_COOLDOWN = 30.0  # in seconds
+
+
+class CodeDropped(Exception):
+    """Queued code was dropped before it was sent."""
+
+
+class QueueEvent(StrEnum):
+    """Change of an item reported to the scheduler observer."""
+
+    QUEUED = "queued"
+    SENDING = "sending"
+    SENT = "sent"
+    DROPPED = "dropped"
+
+
+@dataclass(slots=True)
+class QueueItem:
+    """RF code waiting for transmission on one of its bridges."""
+
+    key: Hashable
+    code: str
+    queued_at: float = 0.0
+    trace: Any = None
+    future: asyncio.Future | None = None
+    bridges: tuple[Hashable, ...] = (None,)
+    failed: set[Hashable] = field(default_factory=set)
+    retries: int = 0  # resends after every bridge failed, only for idempotent codes
+    background: bool = False
+
+
+class RfScheduler:
+    """Queue of RF codes with one lane per switcher, served round robin.
+
+    Every bridge has its own worker taking the next code it may send, so
+    an idle bridge picks up work first. A lane never has two codes on air
+    at once and the same code is never sent by two bridges at a time.
+    Background work only gets airtime on bridges no lane has codes waiting
+    for, a burst of it pauses on a bridge as soon as a code is queued.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[QueueItem, Hashable], Awaitable[None]],
+        gap: Callable[[QueueItem], float],
+        done: Callable[[QueueItem], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        failover_cooldown: float = DEFAULT_FAILOVER_COOLDOWN,
+        observer: Callable[[QueueEvent, QueueItem, Hashable], None] | None = None,
+    ) -> None:
+        """Initialize scheduler."""
+        self._send = send
+        self._gap = gap
+        self._done = done
+        self._clock = clock
+        self._sleep = sleep
+        self._failover_cooldown = failover_cooldown
+        self._observer = observer
+        self._lanes: OrderedDict[Hashable, deque[QueueItem]] = OrderedDict()
+        self._background: OrderedDict[
+            Hashable, Callable[[], list[QueueItem]]
+        ] = OrderedDict()
+        self._burst: deque[QueueItem] = deque()
+        self._size = 0
+        self._active: set[Hashable] = set()
+        # keys dropped while a code of theirs is on air, it is not sent again
+        self._dropped: set[Hashable] = set()
+        self._on_air: set[str] = set()
+        self._down: dict[Hashable, float] = {}
+        self._bridges: dict[Hashable, asyncio.Event] = {}
+        self._idle_since: float | None = clock()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def __len__(self) -> int:
+        """Return number of queued items."""
+        return self._size + len(self._burst)
+
+    def pending(self, key: Hashable) -> int:
+        """Return number of queued items for key."""
+        lane = self._lanes.get(key)
+        burst = sum(1 for item in self._burst if item.key == key)
+        return burst + (len(lane) if lane is not None else 0)
+
+    def idle_for(self) -> float:
+        """Return seconds since the last queued item was sent, 0 while busy."""
+        if self._idle_since is None:
+            return 0.0
+        return self._clock() - self._idle_since
+
+    def has_background(self) -> bool:
+        """Return True while background work is waiting or being sent."""
+        return bool(self._background or self._burst)
+
+    def is_down(self, bridge: Hashable) -> bool:
+        """Return True while bridge is avoided after a failed send."""
+        if (until := self._down.get(bridge)) is None:
+            return False
+        if self._clock() >= until:
+            del self._down[bridge]
+            return False
+        return True
+
+    def _notify(self, bridges: tuple[Hashable, ...] | None = None) -> None:
+        """Wake workers of bridges, all of them by default."""
+        for bridge in self._bridges if bridges is None else bridges:
+            if (event := self._bridges.get(bridge)) is None:
+                event = self._bridges[bridge] = asyncio.Event()
+                self._wakeup.set()
+            event.set()
+
+    def _observe(
+        self, event: QueueEvent, item: QueueItem, bridge: Hashable = None
+    ) -> None:
+        """Report item change to the observer."""
+        if self._observer is not None:
+            self._observer(event, item, bridge)
+
+    def put(self, item: QueueItem) -> None:
+        """Queue item at the end of its lane."""
+        item.queued_at = self._clock()
+        lane = self._lanes.get(item.key)
+        if lane is None:
+            lane = self._lanes[item.key] = deque()
+        lane.append(item)
+        self._size += 1
+        self._idle_since = None
+        self._idle.clear()
+        self._notify(item.bridges)
+        self._observe(QueueEvent.QUEUED, item)
+
+    def put_background(
+        self,
+        key: Hashable,
+        expand: Callable[[], list[QueueItem]],
+        bridges: tuple[Hashable, ...] = (None,),
+    ) -> None:
+        """Queue background work for key on bridges, expanded when it is due.
+
+        Items of one expansion are sent in order, codes of key wait until
+        all of them are sent. Later background work waits until all lanes
+        are empty again.
+        """
+        if key in self._background:
+            return
+        self._background[key] = expand
+        self._idle.clear()
+        self._notify(bridges)
+
+    def _can_send(self, item: QueueItem, bridge: Hashable) -> bool:
+        """Return True when bridge may send item now."""
+        if (
+            item.key in self._active
+            or item.code in self._on_air
+            or bridge not in item.bridges
+            or bridge in item.failed
+        ):
+            return False
+        if not self.is_down(bridge):
+            return True
+        # a failing bridge only gets codes no healthy bridge can take
+        return all(
+            other == bridge or other in item.failed or self.is_down(other)
+            for other in item.bridges
+        )
+
+    def pop(self, bridge: Hashable = None) -> QueueItem | None:
+        """Return next item bridge may send, taking turns between lanes."""
+        for key, lane in self._lanes.items():
+            # codes of a switcher in a burst would upset its planned codes
+            if self._burst and key == self._burst[0].key:
+                continue
+            if self._can_send(lane[0], bridge):
+                break
+        else:
+            return self._pop_burst(bridge)
+
+        item = lane.popleft()
+        if lane:
+            self._lanes.move_to_end(key)
+        else:
+            del self._lanes[key]
+        self._size -= 1
+        return item
+
+    def _pop_burst(self, bridge: Hashable) -> QueueItem | None:
+        """Return next background item, unless a lane waits for bridge."""
+        if not self._burst:
+            return None if self._lanes else self._pop_background(bridge)
+        item = self._burst[0]
+        if not self._can_send(item, bridge) or any(
+            bridge in lane[0].bridges
+            for key, lane in self._lanes.items()
+            if key != item.key
+        ):
+            return None
+        return self._burst.popleft()
+
+    def _pop_background(self, bridge: Hashable) -> QueueItem | None:
+        """Expand background work into items, returning the first one."""
+        while self._background and not self._burst:
+            _, expand = self._background.popitem(last=False)
+            self._burst.extend(items := expand())
+            for item in items:
+                item.background = True
+                self._observe(QueueEvent.QUEUED, item)
+        if not self._burst:
+            return None
+        # a burst on air is no idle time for later background work
+        self._idle_since = None
+        self._notify(self._burst[0].bridges)
+        return self.pop(bridge)
+
+    def drop(self, key: Hashable) -> list[QueueItem]:
+        """Remove and return all queued items for key, failing their waiters."""
+        self._background.pop(key, None)
+        dropped = [item for item in self._burst if item.key == key]
+        if dropped:
+            self._burst = deque(item for item in self._burst if item.key != key)
+
+        if (lane := self._lanes.pop(key, None)) is not None:
+            self._size -= len(lane)
+            dropped.extend(lane)
+        if key in self._active:
+            self._dropped.add(key)
+
+        for item in dropped:
+            if item.future is not None and not item.future.done():
+                item.future.set_exception(CodeDropped(f"RF code {item.code} dropped"))
+            self._observe(QueueEvent.DROPPED, item)
+        return dropped
+
+    def clear(self) -> list[QueueItem]:
+        """Remove and return all queued items, failing their waiters."""
+        dropped = []
+        for key in {*self._lanes, *self._background, *(i.key for i in self._burst)}:
+            dropped.extend(self.drop(key))
+        return dropped
+
+    def _requeue(self, item: QueueItem) -> None:
+        """Put item back at the front of its lane for another bridge."""
+        lane = self._lanes.get(item.key)
+        if lane is None:
+            lane = self._lanes[item.key] = deque()
+        lane.appendleft(item)
+        self._lanes.move_to_end(item.key, last=False)
+        self._size += 1
+        self._observe(QueueEvent.QUEUED, item)
+
+    async def transmit(self, item: QueueItem, bridge: Hashable = None) -> None:
+        """Send item on bridge and keep its lane quiet for the gap."""
+        self._active.add(item.key)
+        self._on_air.add(item.code)
+        self._observe(QueueEvent.SENDING, item, bridge)
+        requeued = retried = False
+        try:
+            await self._send(item, bridge)
+        except Exception as ex:  # pylint: disable=broad-except
+            _LOGGER.exception("Error transmitting RF Code: %s", item.code)
+            item.failed.add(bridge)
+            if len(item.bridges) > 1:
+                self._down[bridge] = self._clock() + self._failover_cooldown
+            if item.key in self._dropped:
+                if item.future is not None and not item.future.done():
+                    item.future.set_exception(
+                        CodeDropped(f"RF code {item.code} dropped")
+                    )
+            elif any(other not in item.failed for other in item.bridges):
+                self._requeue(item)
+                requeued = True
+            elif item.retries > 0:
+                # sending it again can't leave the receiver in a wrong state
+                item.retries -= 1
+                item.failed.clear()
+                self._requeue(item)
+                requeued = retried = True
+            elif item.future is not None and not item.future.done():
+                item.future.set_exception(ex)
+        else:
+            if item.future is not None and not item.future.done():
+                item.future.set_result(None)
+        self._observe(QueueEvent.SENT, item, bridge)
+
+        try:
+            await self._sleep(0 if requeued and not retried else self._gap(item))
+        finally:
+            self._active.discard(item.key)
+            self._dropped.discard(item.key)
+            self._on_air.discard(item.code)
+            self._notify()
+
+        if self._done is not None and not requeued:
+            self._done(item)
+
+    def _check_idle(self) -> None:
+        """Mark queue idle once nothing is waiting or on air."""
+        if len(self) or self._background or self._active:
+            return
+        if self._idle_since is None:
+            self._idle_since = self._clock()
+        self._idle.set()
+
+    async def _run_bridge(self, bridge: Hashable) -> None:
+        """Transmit items on bridge until cancelled."""
+        event = self._bridges[bridge]
+        while True:
+            if (item := self.pop(bridge)) is None:
+                event.clear()
+                self._check_idle()
+                await event.wait()
+                continue
+
+            await self.transmit(item, bridge)
+
+    async def run(self) -> None:
+        """Run a worker for every bridge seen until cancelled."""
+        workers: dict[Hashable, asyncio.Task] = {}
+        try:
+            while True:
+                for bridge in self._bridges.keys() - workers.keys():
+                    workers[bridge] = asyncio.create_task(self._run_bridge(bridge))
+                self._wakeup.clear()
+                await self._wakeup.wait()
+        finally:
+            for task in workers.values():
+                task.cancel()
+            await asyncio.gather(*workers.values(), return_exceptions=True)
+
+    async def drain(self, timeout: float) -> list[QueueItem]:
+        """Wait for queue to empty, return items dropped after timeout."""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except TimeoutError:
+            return self.clear()
+        return []
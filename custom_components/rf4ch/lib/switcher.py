@@ -1,11 +1,14 @@
 """Internal implementation for RF Four Channel Switcher."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from dataclasses import InitVar, dataclass
 from enum import IntEnum, StrEnum
-from typing import NotRequired, TypedDict
+from typing import TypedDict
+
+from .encoding import DEFAULT_PROTOCOL, CodeFormat, InvalidCodeError, encode_bits
 
 INITIAL_SWITCHER_STATE = 0b0000
+DEFAULT_CHANNEL_COUNT = 4
 
 
 class SwitcherChannel(IntEnum):
@@ -15,6 +18,53 @@ class SwitcherChannel(IntEnum):
     B = 1
     C = 2
     D = 3
+    E = 4
+    F = 5
+    G = 6
+    H = 7
+    I = 8  # noqa: E741
+    J = 9
+    K = 10
+    L = 11
+    M = 12
+    N = 13
+    O = 14  # noqa: E741
+    P = 15
+
+
+MAX_CHANNEL_COUNT = len(SwitcherChannel)
+
+CHANNEL_CODE_NAMES = tuple(f"channel_{ch.name.lower()}" for ch in SwitcherChannel)
+CHANNEL_ON_CODE_NAMES = tuple(f"{name}_on" for name in CHANNEL_CODE_NAMES)
+CHANNEL_OFF_CODE_NAMES = tuple(f"{name}_off" for name in CHANNEL_CODE_NAMES)
+CODE_ON = "channel_on"
+CODE_OFF = "channel_off"
+
+# code name -> (channel, state it forces, None for toggle codes)
+_CHANNEL_CODES: dict[str, tuple[SwitcherChannel, bool | None]] = {
+    **{name: (ch, None) for ch, name in zip(SwitcherChannel, CHANNEL_CODE_NAMES)},
+    **{name: (ch, True) for ch, name in zip(SwitcherChannel, CHANNEL_ON_CODE_NAMES)},
+    **{name: (ch, False) for ch, name in zip(SwitcherChannel, CHANNEL_OFF_CODE_NAMES)},
+}
+
+
+def parse_channel_code_name(name: str) -> tuple[SwitcherChannel, bool | None] | None:
+    """Return channel of code name and state it forces, None for toggles."""
+    return _CHANNEL_CODES.get(name)
+
+
+def apply_code_name(state: int, name: str, channel_count: int) -> int | None:
+    """Return state a receiver gets to with named code, None for unknown names."""
+    if name == CODE_ON:
+        return (1 << channel_count) - 1
+    if name == CODE_OFF:
+        return 0
+    if (parsed := _CHANNEL_CODES.get(name)) is None or parsed[0] >= channel_count:
+        return None
+    channel, forced = parsed
+    if forced is None:
+        return state ^ 1 << channel
+    return state | 1 << channel if forced else state & ~(1 << channel)
 
 
 class SwitcherAction(StrEnum):
@@ -26,11 +76,33 @@ class SwitcherAction(StrEnum):
 
 
 class SwitcherState:
-    """Class for switcher state."""
+    """Class for switcher state, one bit per channel."""
+
+    __slots__ = ("__state", "__mask", "__width")
 
-    def __init__(self, initial_state: int = INITIAL_SWITCHER_STATE) -> None:
+    def __init__(
+        self,
+        initial_state: int = INITIAL_SWITCHER_STATE,
+        channel_count: int = DEFAULT_CHANNEL_COUNT,
+    ) -> None:
         """Initialize switcher state."""
-        self.__state = initial_state
+        self.__width = channel_count
+        self.__mask = (1 << channel_count) - 1
+        self.__state = initial_state & self.__mask
+
+    @property
+    def value(self) -> int:
+        """Return state bitmask."""
+        return self.__state
+
+    @property
+    def mask(self) -> int:
+        """Return bitmask with all channels on."""
+        return self.__mask
+
+    def set_value(self, value: int):
+        """Set state bitmask."""
+        self.__state = value & self.__mask
 
     def set_channel(self, channel: SwitcherChannel, state: bool):
         """Set channel state."""
@@ -42,79 +114,241 @@ class SwitcherState:
 
     def turn_on_all(self):
         """Turn on all channels."""
-        self.__state = 0b1111
+        self.__state = self.__mask
 
     def turn_off_all(self):
         """Turn off all channels."""
-        self.__state = 0b0000
+        self.__state = 0
 
     def is_all_off(self):
         """Check if all channels are off."""
-        return self.__state == 0b0000
+        return self.__state == 0
 
     def is_all_on(self):
         """Check if all channels are on."""
-        return self.__state == 0b1111
+        return self.__state == self.__mask
 
     def __str__(self):
         """Return string representation of instance for debugging."""
-        return f"SwitcherState(state=0b{self.__state:04b})"
+        return f"SwitcherState(state=0b{self.__state:0{self.__width}b})"
+
 
+class SwitcherCodeDict(TypedDict, total=False):
+    """Switcher code dictionary, channel codes are given from channel_a on.
 
-class SwitcherCodeDict(TypedDict):
-    """Switcher code dictionary."""
+    Toggle codes are required, discrete on and off codes are optional.
+    """
 
     channel_a: str
     channel_b: str
     channel_c: str
     channel_d: str
+    channel_e: str
+    channel_f: str
+    channel_g: str
+    channel_h: str
+    channel_i: str
+    channel_j: str
+    channel_k: str
+    channel_l: str
+    channel_m: str
+    channel_n: str
+    channel_o: str
+    channel_p: str
+    channel_a_on: str
+    channel_a_off: str
+    channel_b_on: str
+    channel_b_off: str
+    channel_c_on: str
+    channel_c_off: str
+    channel_d_on: str
+    channel_d_off: str
+    channel_e_on: str
+    channel_e_off: str
+    channel_f_on: str
+    channel_f_off: str
+    channel_g_on: str
+    channel_g_off: str
+    channel_h_on: str
+    channel_h_off: str
+    channel_i_on: str
+    channel_i_off: str
+    channel_j_on: str
+    channel_j_off: str
+    channel_k_on: str
+    channel_k_off: str
+    channel_l_on: str
+    channel_l_off: str
+    channel_m_on: str
+    channel_m_off: str
+    channel_n_on: str
+    channel_n_off: str
+    channel_o_on: str
+    channel_o_off: str
+    channel_p_on: str
+    channel_p_off: str
     channel_off: str
     channel_on: str
-    prefix: NotRequired[str]
+    prefix: str
+    format: str
+    protocol: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SwitcherCode:
-    """Class for switcher code."""
-
-    channel_a: str
-    channel_b: str
-    channel_c: str
-    channel_d: str
-    channel_off: str
-    channel_on: str
+    """Class for switcher code, pre-encoded into bit strings."""
+
+    channels: tuple[str, ...]
+    channel_on: str | None = None
+    channel_off: str | None = None
+    protocol: int = DEFAULT_PROTOCOL
+    channels_on: tuple[str | None, ...] = ()
+    channels_off: tuple[str | None, ...] = ()
     prefix: InitVar[str | None] = None
+    format: InitVar[str | None] = None
+
+    @property
+    def channel_count(self) -> int:
+        """Return number of channels."""
+        return len(self.channels)
+
+    @property
+    def discrete(self) -> bool:
+        """Return True when every channel has its own on and off code."""
+        return None not in self.channels_on and None not in self.channels_off
 
     def get_code_for_channel(self, channel: SwitcherChannel):
         """Get code for channel."""
-        if channel == SwitcherChannel.A:
-            return self.channel_a
-        if channel == SwitcherChannel.B:
-            return self.channel_b
-        if channel == SwitcherChannel.C:
-            return self.channel_c
-        if channel == SwitcherChannel.D:
-            return self.channel_d
-
-    def __post_init__(self, prefix):
-        """Post init."""
-        if prefix is not None:
-            object.__setattr__(self, "channel_a", prefix + self.channel_a)
-            object.__setattr__(self, "channel_b", prefix + self.channel_b)
-            object.__setattr__(self, "channel_c", prefix + self.channel_c)
-            object.__setattr__(self, "channel_d", prefix + self.channel_d)
-            object.__setattr__(self, "channel_off", prefix + self.channel_off)
-            object.__setattr__(self, "channel_on", prefix + self.channel_on)
+        return self.channels[channel]
+
+    def get_discrete_code(self, channel: SwitcherChannel, state: bool) -> str | None:
+        """Get code forcing channel to state, None when it only toggles."""
+        return (self.channels_on if state else self.channels_off)[channel]
+
+    def get_code_for_state(self, channel: SwitcherChannel, state: bool) -> str:
+        """Get code moving channel to state from the opposite one."""
+        if (code := self.get_discrete_code(channel, state)) is not None:
+            return code
+        return self.channels[channel]
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Iterate over code names and encoded codes."""
+        yield from zip(CHANNEL_CODE_NAMES, self.channels)
+        for names, codes in (
+            (CHANNEL_ON_CODE_NAMES, self.channels_on),
+            (CHANNEL_OFF_CODE_NAMES, self.channels_off),
+        ):
+            yield from ((n, c) for n, c in zip(names, codes) if c is not None)
+        if self.channel_off is not None:
+            yield CODE_OFF, self.channel_off
+        if self.channel_on is not None:
+            yield CODE_ON, self.channel_on
+
+    def __post_init__(self, prefix, format):  # pylint: disable=redefined-builtin
+        """Encode codes, raises InvalidCodeError for malformed codes."""
+        try:
+            code_format = CodeFormat(format or CodeFormat.BINARY)
+        except ValueError as ex:
+            raise InvalidCodeError(f"Unknown code format: {format!r}") from ex
+
+        if not 0 < len(self.channels) <= MAX_CHANNEL_COUNT:
+            raise InvalidCodeError(
+                f"Expected 1 to {MAX_CHANNEL_COUNT} channel codes,"
+                f" got {len(self.channels)}"
+            )
+
+        encoded_prefix = encode_bits(prefix, code_format) if prefix else ""
+
+        def _encode(code: str | None) -> str | None:
+            if code is None:
+                return None
+            return encoded_prefix + encode_bits(code, code_format)
+
+        count = len(self.channels)
+        for field_name in ("channels_on", "channels_off"):
+            codes = getattr(self, field_name)
+            if len(codes) > count:
+                raise InvalidCodeError("Discrete codes given for missing channels")
+            codes = (*map(_encode, codes), *(None,) * (count - len(codes)))
+            object.__setattr__(self, field_name, codes)
+
+        object.__setattr__(self, "channels", tuple(map(_encode, self.channels)))
+        object.__setattr__(self, "channel_on", _encode(self.channel_on))
+        object.__setattr__(self, "channel_off", _encode(self.channel_off))
 
     @staticmethod
     def from_dict(d: SwitcherCodeDict):
         """Create instance from dictionary."""
-        return SwitcherCode(**d)
+        channels = []
+        for name in CHANNEL_CODE_NAMES:
+            if name not in d:
+                break
+            channels.append(d[name])
+
+        if any(name in d for name in CHANNEL_CODE_NAMES[len(channels) :]):
+            raise InvalidCodeError("Channel codes must start at channel_a without gaps")
+        if any(
+            name in d
+            for names in (CHANNEL_ON_CODE_NAMES, CHANNEL_OFF_CODE_NAMES)
+            for name in names[len(channels) :]
+        ):
+            raise InvalidCodeError("Discrete codes given for missing channels")
+
+        return SwitcherCode(
+            tuple(channels),
+            channel_on=d.get(CODE_ON),
+            channel_off=d.get(CODE_OFF),
+            protocol=d.get("protocol") or DEFAULT_PROTOCOL,
+            channels_on=tuple(d.get(n) for n in CHANNEL_ON_CODE_NAMES[: len(channels)]),
+            channels_off=tuple(
+                d.get(n) for n in CHANNEL_OFF_CODE_NAMES[: len(channels)]
+            ),
+            prefix=d.get("prefix"),
+            format=d.get("format"),
+        )
+
+
+def _channel_codes(code: SwitcherCode, channels: int, target: int) -> list[str]:
+    """Return codes moving channels set in bitmask to their target state."""
+    return [
+        code.get_code_for_state(SwitcherChannel(ch), bool(target >> ch & 1))
+        for ch in range(code.channel_count)
+        if channels >> ch & 1
+    ]
+
+
+def plan_sync(code: SwitcherCode, target: int) -> list[str] | None:
+    """Return cheapest codes forcing target from any state.
+
+    Returns None when the switcher has neither group codes to start from
+    nor discrete codes for every channel.
+    """
+    mask = (1 << code.channel_count) - 1
+    plans = []
+    if code.channel_off is not None:
+        plans.append([code.channel_off, *_channel_codes(code, target, target)])
+    if code.channel_on is not None:
+        plans.append([code.channel_on, *_channel_codes(code, ~target & mask, target)])
+    if code.discrete:
+        plans.append(_channel_codes(code, mask, target))
+    if not plans:
+        return None
+    return min(plans, key=len)
+
+
+def plan_transition(code: SwitcherCode, current: int, target: int) -> list[str]:
+    """Return cheapest codes moving channels from current to target state."""
+    toggles = _channel_codes(code, current ^ target, target)
+    if (sync := plan_sync(code, target)) is not None and len(sync) < len(toggles):
+        return sync
+    return toggles
 
 
 class Switcher:
     """Class for RF Four Channel Switcher."""
 
+    __slots__ = ("__c", "__s", "__send_rf_callback")
+
     def __init__(
         self,
         code: SwitcherCodeDict,
@@ -123,9 +357,34 @@ class Switcher:
     ) -> None:
         """Initialize switcher."""
         self.__c = SwitcherCode.from_dict(code)
-        self.__s = SwitcherState(initial_state)
+        self.__s = SwitcherState(initial_state, self.__c.channel_count)
         self.__send_rf_callback = send_rf_callback
 
+    @property
+    def code(self) -> SwitcherCode:
+        """Return switcher code."""
+        return self.__c
+
+    @property
+    def channel_count(self) -> int:
+        """Return number of channels."""
+        return self.__c.channel_count
+
+    @property
+    def channels(self) -> tuple[SwitcherChannel, ...]:
+        """Return channels of this switcher."""
+        return tuple(SwitcherChannel(ch) for ch in range(self.channel_count))
+
+    @property
+    def state(self) -> int:
+        """Return channel state bitmask."""
+        return self.__s.value
+
+    def update_code(self, code: SwitcherCodeDict) -> None:
+        """Replace codes, keeping channel state of remaining channels."""
+        self.__c = SwitcherCode.from_dict(code)
+        self.__s = SwitcherState(self.__s.value, self.__c.channel_count)
+
     def __send_rf_code(self, code: str):
         if self.__send_rf_callback is not None:
             self.__send_rf_callback(code)
@@ -143,7 +402,17 @@ class Switcher:
 
         self.__s.set_channel(channel, state)
         if not only_internal:
-            self.__send_rf_code(self.__c.get_code_for_channel(channel))
+            self.__send_rf_code(self.__c.get_code_for_state(channel, state))
+
+    def set_state(self, target: int, only_internal: bool = False) -> int:
+        """Move all channels to target bitmask, return number of codes sent."""
+        codes = plan_transition(self.__c, self.__s.value, target)
+        self.__s.set_value(target)
+        if only_internal:
+            return 0
+        for code in codes:
+            self.__send_rf_code(code)
+        return len(codes)
 
     def toggle_channel(self, channel: SwitcherChannel, force: bool = False):
         """Toggle channel state."""
@@ -152,28 +421,48 @@ class Switcher:
         )
         self.__send_rf_code(self.__c.get_code_for_channel(channel))
 
+    def send_channel(self, channel: SwitcherChannel, state: bool):
+        """Send channel code without relying on its state, e.g. when stateless.
+
+        Sends the discrete code when there is one and toggles otherwise.
+        """
+        if (code := self.__c.get_discrete_code(channel, state)) is None:
+            self.toggle_channel(channel, False)
+            return
+        self.__s.set_channel(channel, state)
+        self.__send_rf_code(code)
+
     def turn_on_all(self):
         """Turn on all channels."""
+        if self.__c.channel_on is None:
+            self.set_state(self.__s.mask)
+            return
         self.__s.turn_on_all()
         self.__send_rf_code(self.__c.channel_on)
 
     def turn_off_all(self):
         """Turn off all channels."""
+        if self.__c.channel_off is None:
+            self.set_state(0)
+            return
         self.__s.turn_off_all()
         self.__send_rf_code(self.__c.channel_off)
 
-    def sync_channels(self):
-        """Sync channels."""
-        if self.__s.is_all_on():
-            self.turn_on_all()
-        elif self.__s.is_all_off():
-            self.turn_off_all()
-        else:
-            self.__send_rf_code(self.__c.channel_off)
-
-            for ch in SwitcherChannel:
-                if self.__s.get_channel(ch):
-                    self.__send_rf_code(self.__c.get_code_for_channel(ch))
+    def sync_channels(self) -> bool:
+        """Sync channels, returns False when there are no group codes to sync."""
+        if (codes := plan_sync(self.__c, self.__s.value)) is None:
+            return False
+        for code in codes:
+            self.__send_rf_code(code)
+        return True
+
+    def handle_received_code(self, name: str) -> bool:
+        """Update state for code heard from another transmitter, e.g. a remote."""
+        state = apply_code_name(self.__s.value, name, self.channel_count)
+        if state is None:
+            return False
+        self.__s.set_value(state)
+        return True
 
     def __str__(self):
         """Return string representation of instance for debugging."""
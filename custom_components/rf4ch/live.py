@@ -0,0 +1,221 @@
+"""Live queue and switcher state feed for RF Four Channel integration."""
+
+from collections.abc import Hashable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN, LIVE_UPDATE_INTERVAL, WS_TYPE_SUBSCRIBE
+from .lib.scheduler import QueueEvent, QueueItem, RfScheduler
+from .models import RfSwitcher
+
+ATTR_LIVE_FEED = "RF_LIVE_FEED"
+
+
+class RfLiveSubscription:
+    """Changes collected for one websocket subscriber between updates."""
+
+    def __init__(
+        self,
+        feed: "RfLiveFeed",
+        connection: websocket_api.ActiveConnection,
+        msg_id: int,
+        interval: float,
+    ) -> None:
+        """Initialize subscription."""
+        self._feed = feed
+        self._connection = connection
+        self._msg_id = msg_id
+        self._interval = interval
+        self._queued: set[RfSwitcher] = set()
+        self._states: set[RfSwitcher] = set()
+        self._on_air: dict[Hashable, QueueItem | None] = {}
+        self._handle = None
+
+    @callback
+    def _schedule(self) -> None:
+        """Send collected changes once the interval has passed."""
+        if self._handle is None:
+            self._handle = self._feed.hass.loop.call_later(
+                self._interval, self._async_flush
+            )
+
+    @callback
+    def queue_changed(self, switcher: RfSwitcher) -> None:
+        """Collect change of queued codes of switcher."""
+        self._queued.add(switcher)
+        self._schedule()
+
+    @callback
+    def state_changed(self, switcher: RfSwitcher) -> None:
+        """Collect change of switcher state."""
+        self._states.add(switcher)
+        self._schedule()
+
+    @callback
+    def on_air_changed(self, bridge: Hashable, item: QueueItem | None) -> None:
+        """Collect code going on or off air on bridge."""
+        self._on_air[bridge] = item
+        self._schedule()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send collected changes as one message."""
+        self._handle = None
+        queued, self._queued = self._queued, set()
+        states, self._states = self._states, set()
+        on_air, self._on_air = self._on_air, {}
+        self._connection.send_message(
+            websocket_api.event_message(
+                self._msg_id,
+                self._feed.build_update(queued, states, on_air),
+            )
+        )
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Stop sending updates."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._feed.subscriptions.remove(self)
+
+
+class RfLiveFeed:
+    """Fan out queue and switcher state changes to websocket subscribers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize feed."""
+        self.hass = hass
+        self.queue: RfScheduler | None = None
+        self.subscriptions: list[RfLiveSubscription] = []
+        self._switchers: set[RfSwitcher] = set()
+
+    @callback
+    def async_register(self, switcher: RfSwitcher) -> CALLBACK_TYPE:
+        """Register switcher for snapshots."""
+        self._switchers.add(switcher)
+
+        @callback
+        def _async_unregister() -> None:
+            self._switchers.discard(switcher)
+            for subscription in self.subscriptions:
+                subscription.queue_changed(switcher)
+
+        return _async_unregister
+
+    @callback
+    def async_queue_event(
+        self, event: QueueEvent, item: QueueItem, bridge: Hashable
+    ) -> None:
+        """Collect queue change reported by the scheduler."""
+        for subscription in self.subscriptions:
+            if event == QueueEvent.SENDING:
+                subscription.on_air_changed(bridge, item)
+            elif event == QueueEvent.SENT:
+                subscription.on_air_changed(bridge, None)
+            subscription.queue_changed(item.key)
+
+    @callback
+    def async_state_changed(self, switcher: RfSwitcher) -> None:
+        """Collect switcher state change."""
+        for subscription in self.subscriptions:
+            subscription.state_changed(switcher)
+
+    def _queue_entry(self, switcher: RfSwitcher) -> tuple[str, str, int]:
+        """Return bridge, switcher id and number of queued codes."""
+        pending = self.queue.pending(switcher) if self.queue is not None else 0
+        if switcher not in self._switchers:
+            pending = 0
+        return switcher.bridge_id, switcher.unique_id, pending
+
+    @staticmethod
+    def _on_air_entry(item: QueueItem | None) -> dict[str, Any] | None:
+        """Return description of code on air."""
+        if item is None:
+            return None
+        return {
+            "switcher": item.key.unique_id,
+            "code": item.code,
+            "label": item.key.code_labels.get(item.code),
+        }
+
+    def build_update(
+        self,
+        queued: set[RfSwitcher],
+        states: set[RfSwitcher],
+        on_air: dict[Hashable, QueueItem | None],
+    ) -> dict[str, Any]:
+        """Return delta message for changed switchers and bridges."""
+        queue: dict[str, dict[str, int]] = {}
+        for switcher in queued:
+            bridge, unique_id, pending = self._queue_entry(switcher)
+            queue.setdefault(bridge, {})[unique_id] = pending
+        return {
+            "queue": queue,
+            "on_air": {
+                bridge: self._on_air_entry(item) for bridge, item in on_air.items()
+            },
+            "switchers": {
+                switcher.unique_id: switcher.state
+                for switcher in states
+                if switcher in self._switchers
+            },
+        }
+
+    def build_snapshot(self) -> dict[str, Any]:
+        """Return full state, sent once to new subscribers."""
+        return self.build_update(
+            {
+                switcher
+                for switcher in self._switchers
+                if self.queue is not None and self.queue.pending(switcher)
+            },
+            self._switchers,
+            {},
+        )
+
+
+@callback
+def async_get_live_feed(hass: HomeAssistant) -> RfLiveFeed:
+    """Get shared live feed."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if ATTR_LIVE_FEED not in data:
+        data[ATTR_LIVE_FEED] = RfLiveFeed(hass)
+    return data[ATTR_LIVE_FEED]
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE,
+        vol.Optional("interval", default=LIVE_UPDATE_INTERVAL): vol.All(
+            vol.Coerce(float), vol.Range(min=0.05, max=60)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Subscribe to batched queue and switcher state changes."""
+    feed = async_get_live_feed(hass)
+    subscription = RfLiveSubscription(feed, connection, msg["id"], msg["interval"])
+    feed.subscriptions.append(subscription)
+    connection.subscriptions[msg["id"]] = subscription.async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], feed.build_snapshot())
+    )
+
+
+@callback
+def async_setup_live_feed(hass: HomeAssistant, queue: RfScheduler) -> RfLiveFeed:
+    """Set up live feed of queue and register its websocket command."""
+    feed = async_get_live_feed(hass)
+    feed.queue = queue
+    websocket_api.async_register_command(hass, websocket_subscribe)
+    return feed
@@ -1,10 +1,55 @@
 """Data Models for RF Four Channel Integration."""
 
-from typing import Protocol
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import NotRequired, Protocol, TypedDict
 
-from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity import DeviceInfo, Entity
 
-from .lib.switcher import SwitcherAction, SwitcherChannel
+from .const import DEFAULT_BATCH_WINDOW, DEFAULT_RESYNC_INTERVAL
+from .lib.switcher import SwitcherAction, SwitcherChannel, SwitcherCodeDict
+
+
+class RfServiceDict(TypedDict):
+    """RF service dictionary."""
+
+    id: str
+    data: dict
+    bridges: NotRequired[list[str]]
+    payload: NotRequired[str]
+    receive_event: NotRequired[str]
+
+
+class UnavailablePolicy(StrEnum):
+    """What to do with codes of a switcher while it is unavailable."""
+
+    SEND = "send"
+    HOLD = "hold"
+    DROP = "drop"
+
+
+@dataclass(frozen=True, slots=True)
+class SwitcherOptions:
+    """Switcher options."""
+
+    stateless: bool
+    await_transmission: bool = False
+    batch_window: float = DEFAULT_BATCH_WINDOW
+    resync_interval: int = DEFAULT_RESYNC_INTERVAL
+    unavailable_policy: UnavailablePolicy = UnavailablePolicy.SEND
+
+
+@dataclass(frozen=True, slots=True)
+class SwitcherConfig:
+    """Switcher config."""
+
+    name: str
+    unique_id: str
+    code: SwitcherCodeDict
+    service: RfServiceDict
+    availability_template: str
+    transmission_gap: float | None
+    device_info: DeviceInfo
 
 
 class RfSwitcher(Protocol):
@@ -22,10 +67,58 @@ class RfSwitcher(Protocol):
     def device_info(self) -> dict[str, str]:
         """Return device info."""
 
+    @property
+    def bridge_id(self) -> str:
+        """Return id of the RF bridge service."""
+
+    @property
+    def bridges(self) -> tuple[str, ...]:
+        """Return ids of RF bridge services able to reach the switcher."""
+
     @property
     def available(self) -> bool:
         """Return availability."""
 
+    @property
+    def is_stateless(self) -> bool:
+        """Return True when channel states are not tracked."""
+
+    @property
+    def channel_count(self) -> int:
+        """Return number of channels."""
+
+    @property
+    def channels(self) -> tuple[SwitcherChannel, ...]:
+        """Return channels of the switcher."""
+
+    @property
+    def state(self) -> int:
+        """Return channel state bitmask."""
+
+    @property
+    def codes(self) -> dict[str, str]:
+        """Return encoded codes by name."""
+
+    @property
+    def code_labels(self) -> dict[str, str]:
+        """Return code names by encoded code."""
+
+    @property
+    def synced_at(self) -> float:
+        """Return monotonic time the whole state was last sent."""
+
+    def resync_due(self, now: float) -> bool:
+        """Return True when a background resync is due."""
+
+    def async_request_resync(self) -> None:
+        """Queue background resync."""
+
+    def async_handle_received_code(self, name: str) -> None:
+        """Update state from code received by the bridge."""
+
+    def attach_entity(self, platform: str, key: str, entity: Entity) -> None:
+        """Attach entity created by platform to follow switcher state."""
+
     def get_entities_for_platform(self, platform: str) -> list[Entity]:
         """Get entities for platform."""
 
@@ -37,6 +130,15 @@ class RfSwitcher(Protocol):
     ):
         """Set channel state."""
 
+    async def async_set_channel(self, channel: SwitcherChannel, state: bool) -> None:
+        """Set channel state, optionally waiting for the code to be sent."""
+
+    def set_state(self, state: int) -> int:
+        """Move all channels to state bitmask, return number of codes sent."""
+
+    async def async_set_state(self, state: int) -> None:
+        """Move all channels to state, optionally waiting for the codes."""
+
     def turn_on_all(self):
         """Turn on all channels."""
 
@@ -48,3 +150,6 @@ class RfSwitcher(Protocol):
 
     def handle_action(self, action: SwitcherAction):
         """Handle action."""
+
+    async def async_handle_action(self, action: SwitcherAction) -> None:
+        """Handle action, optionally waiting for the codes to be sent."""
@@ -0,0 +1,82 @@
+"""On-demand profiling for RF Four Channel integration."""
+
+import cProfile
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_PROFILER = "RF_PROFILER"
+
+
+class RfProfile:
+    """cProfile capture of the event loop running the RF pipeline.
+
+    Queue worker, entity commands and template callbacks all run on the
+    event loop, nothing is hooked while no capture runs.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize capture."""
+        self.hass = hass
+        self.started = time.time()
+        self._profiler = cProfile.Profile()
+        self.unsub_timeout: CALLBACK_TYPE | None = None
+
+    def enable(self) -> None:
+        """Start capture."""
+        try:
+            self._profiler.enable()
+        except ValueError as ex:
+            raise HomeAssistantError(f"Unable to start profiling: {ex}") from ex
+
+    async def async_dump(self) -> str:
+        """Stop capture and write stats file, return its path."""
+        self._profiler.disable()
+        path = self.hass.config.path(
+            f"rf4ch_profile_{time.strftime('%Y%m%d_%H%M%S')}.prof"
+        )
+        await self.hass.async_add_executor_job(self._profiler.dump_stats, path)
+        return path
+
+
+@callback
+def async_start_profile(hass: HomeAssistant, duration: float | None) -> None:
+    """Start profiling, stopping by itself after duration seconds if given."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if data.get(ATTR_PROFILER) is not None:
+        raise HomeAssistantError("Profiling is already running")
+
+    profile = RfProfile(hass)
+    profile.enable()
+    data[ATTR_PROFILER] = profile
+    _LOGGER.info("Profiling started")
+
+    if duration:
+
+        async def _async_timeout(_) -> None:
+            profile.unsub_timeout = None
+            await async_stop_profile(hass)
+
+        profile.unsub_timeout = async_call_later(hass, duration, _async_timeout)
+
+
+async def async_stop_profile(hass: HomeAssistant) -> str | None:
+    """Stop profiling, return path of written stats file."""
+    if (profile := hass.data.get(DOMAIN, {}).pop(ATTR_PROFILER, None)) is None:
+        return None
+    if profile.unsub_timeout is not None:
+        profile.unsub_timeout()
+    path = await profile.async_dump()
+    _LOGGER.info(
+        "Profiled %.1f seconds, stats written to %s",
+        time.time() - profile.started,
+        path,
+    )
+    return path
@@ -0,0 +1,83 @@
+"""Receive path for RF Four Channel integration."""
+
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from .const import ATTR_CODE, DOMAIN, RECEIVE_ECHO_WINDOW, RECEIVE_REPEAT_WINDOW
+from .lib.receiver import CodeIndex, ReceiveFilter, normalise_code
+from .models import RfSwitcher
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_RECEIVER = "RF_RECEIVER"
+
+
+class RfReceiver:
+    """Route codes received by RF bridges to switchers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize receiver."""
+        self.hass = hass
+        self._index: CodeIndex[RfSwitcher] = CodeIndex()
+        self._filter = ReceiveFilter(RECEIVE_REPEAT_WINDOW, RECEIVE_ECHO_WINDOW)
+        self._listeners: dict[str, CALLBACK_TYPE] = {}
+        self._subscribers: dict[str, int] = {}
+
+    @callback
+    def async_register(self, switcher: RfSwitcher, event_type: str) -> CALLBACK_TYPE:
+        """Register switcher codes and listen to receive event of its bridge."""
+        for clash in self._index.add(switcher, dict(switcher.codes)):
+            _LOGGER.warning(
+                "Switchers %s and %s share RF codes, received codes are routed to %s",
+                clash.unique_id,
+                switcher.unique_id,
+                switcher.unique_id,
+            )
+
+        if event_type not in self._listeners:
+            self._listeners[event_type] = self.hass.bus.async_listen(
+                event_type, self._async_handle_event
+            )
+        self._subscribers[event_type] = self._subscribers.get(event_type, 0) + 1
+
+        @callback
+        def _async_unregister() -> None:
+            self._index.remove(switcher)
+            self._subscribers[event_type] -= 1
+            if self._subscribers[event_type] == 0:
+                del self._subscribers[event_type]
+                self._listeners.pop(event_type)()
+
+        return _async_unregister
+
+    @callback
+    def async_code_sent(self, code: str) -> None:
+        """Remember code we are sending so its echo is not taken as a press."""
+        if (key := normalise_code(code)) is not None:
+            self._filter.sent(key, time.monotonic())
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        """Handle code received by bridge."""
+        if (key := normalise_code(event.data.get(ATTR_CODE))) is None:
+            return
+        if (match := self._index.lookup(key)) is None:
+            return
+
+        switcher, name = match
+        if not self._filter.accept(key, time.monotonic()):
+            _LOGGER.debug("Dropped repeat or echo of %s", name)
+            return
+        _LOGGER.debug("Received %s for %s", name, switcher.unique_id)
+        switcher.async_handle_received_code(name)
+
+
+@callback
+def async_get_receiver(hass: HomeAssistant) -> RfReceiver:
+    """Get shared receiver."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if ATTR_RECEIVER not in data:
+        data[ATTR_RECEIVER] = RfReceiver(hass)
+    return data[ATTR_RECEIVER]
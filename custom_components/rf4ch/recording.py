@@ -0,0 +1,102 @@
+"""Traffic recording for RF Four Channel integration."""
+
+import asyncio
+import logging
+import os
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import raise_if_invalid_filename
+
+from .const import DOMAIN, RECORDING_FLUSH_LINES
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_RECORDING = "RF_RECORDING"
+
+
+class RfRecording:
+    """Record queued codes to a file for offline replay."""
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize recording."""
+        # gzip is only imported once a recording is started
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.replay import Recorder
+
+        self.hass = hass
+        self.path = path
+        self._recorder = Recorder()
+        self._lock = asyncio.Lock()
+        # an earlier recording in the same file is replaced, not extended
+        self._append = False
+
+    @callback
+    def record(
+        self, switcher: str, label: str | None, code: str, gap: float | None
+    ) -> None:
+        """Record queued code, writing to disk in the background now and then."""
+        self._recorder.record(switcher, label, code, gap)
+        if len(self._recorder) >= RECORDING_FLUSH_LINES:
+            self.hass.async_create_task(self._async_write(self._recorder.take()))
+
+    async def _async_write(self, lines: list[str]) -> None:
+        """Write lines to file, one write at a time."""
+        # pylint: disable-next=import-outside-toplevel
+        from .lib.replay import write_recording
+
+        async with self._lock:
+            await self.hass.async_add_executor_job(
+                write_recording, self.path, lines, self._append
+            )
+            self._append = True
+
+    async def async_close(self) -> int:
+        """Write remaining lines, return number of recorded codes."""
+        await self._async_write(self._recorder.take())
+        return self._recorder.recorded
+
+
+async def async_recording_path(hass: HomeAssistant, filename: str) -> str:
+    """Return path to record to, raising for files outside allowed folders.
+
+    Plain file names are kept in the config folder, other paths have to be
+    absolute and in an allowlisted external folder.
+    """
+    try:
+        raise_if_invalid_filename(filename)
+    except ValueError as ex:
+        if os.path.isabs(filename) and await hass.async_add_executor_job(
+            hass.config.is_allowed_path, filename
+        ):
+            return filename
+        raise HomeAssistantError(
+            f"Recording file {filename} is neither a file name in the config "
+            "folder nor in an allowlisted external folder"
+        ) from ex
+    return hass.config.path(filename)
+
+
+@callback
+def async_get_recording(hass: HomeAssistant) -> RfRecording | None:
+    """Get running recording."""
+    return hass.data.get(DOMAIN, {}).get(ATTR_RECORDING)
+
+
+@callback
+def async_start_recording(hass: HomeAssistant, path: str) -> RfRecording:
+    """Start recording queued codes to path."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if (recording := data.get(ATTR_RECORDING)) is not None:
+        return recording
+    recording = data[ATTR_RECORDING] = RfRecording(hass, path)
+    _LOGGER.info("Recording RF traffic to %s", path)
+    return recording
+
+
+async def async_stop_recording(hass: HomeAssistant) -> None:
+    """Stop running recording."""
+    if (recording := hass.data.get(DOMAIN, {}).pop(ATTR_RECORDING, None)) is None:
+        return
+    recorded = await recording.async_close()
+    _LOGGER.info("Recorded %s RF codes to %s", recorded, recording.path)
@@ -0,0 +1,77 @@
+"""Background resync for RF Four Channel integration."""
+
+from datetime import timedelta
+import logging
+import time
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, RESYNC_CHECK_INTERVAL, RESYNC_IDLE_DELAY
+from .lib.scheduler import RfScheduler
+from .models import RfSwitcher
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_RESYNC = "RF_RESYNC"
+
+
+class RfResync:
+    """Resync stalest switcher whenever the RF queue has been idle for a while."""
+
+    def __init__(self, hass: HomeAssistant, queue: RfScheduler) -> None:
+        """Initialize resync."""
+        self.hass = hass
+        self._queue = queue
+        self._switchers: set[RfSwitcher] = set()
+        self._unsub_interval: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_register(self, switcher: RfSwitcher) -> CALLBACK_TYPE:
+        """Register switcher for background resync."""
+        self._switchers.add(switcher)
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(
+                self.hass,
+                self._async_check,
+                timedelta(seconds=RESYNC_CHECK_INTERVAL),
+            )
+
+        @callback
+        def _async_unregister() -> None:
+            self._switchers.discard(switcher)
+            if not self._switchers and self._unsub_interval is not None:
+                self._unsub_interval()
+                self._unsub_interval = None
+
+        return _async_unregister
+
+    @callback
+    def _async_check(self, *_) -> None:
+        """Queue resync of the stalest due switcher on an idle queue."""
+        if self._queue.idle_for() < RESYNC_IDLE_DELAY or self._queue.has_background():
+            return
+
+        now = time.monotonic()
+        due = [switcher for switcher in self._switchers if switcher.resync_due(now)]
+        if not due:
+            return
+
+        switcher = min(due, key=lambda switcher: switcher.synced_at)
+        _LOGGER.debug("Resyncing %s in the background", switcher.unique_id)
+        switcher.async_request_resync()
+
+
+@callback
+def async_setup_resync(hass: HomeAssistant, queue: RfScheduler) -> RfResync:
+    """Set up shared background resync for queue."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if ATTR_RESYNC not in data:
+        data[ATTR_RESYNC] = RfResync(hass, queue)
+    return data[ATTR_RESYNC]
+
+
+@callback
+def async_get_resync(hass: HomeAssistant) -> RfResync | None:
+    """Get shared background resync, if there is a queue."""
+    return hass.data.get(DOMAIN, {}).get(ATTR_RESYNC)
@@ -6,44 +6,91 @@ import homeassistant.helpers.config_validation as cv
 
 from .const import (
     CONF_AVAILABILITY_TEMPLATE,
+    CONF_AWAIT_TRANSMISSION,
+    CONF_BATCH_WINDOW,
+    CONF_BRIDGES,
     CONF_CODE,
-    CONF_CODE_A,
-    CONF_CODE_B,
-    CONF_CODE_C,
-    CONF_CODE_D,
+    CONF_CODE_FORMAT,
     CONF_CODE_OFF,
     CONF_CODE_ON,
     CONF_CODE_PREFIX,
+    CONF_CODE_PROTOCOL,
+    CONF_COORDINATOR,
     CONF_ID,
     CONF_NAME,
     CONF_OPTIONS,
+    CONF_PAYLOAD,
+    CONF_RECEIVE_EVENT,
+    CONF_RESYNC_INTERVAL,
     CONF_SERVICE,
+    CONF_SERVE,
     CONF_SERVICE_DATA,
+    CONF_SOCKET,
     CONF_STATELESS,
     CONF_TRANSMISSION_GAP,
+    CONF_UNAVAILABLE_POLICY,
 )
+from .lib.encoding import PROTOCOLS, CodeFormat, InvalidCodeError, PayloadType
+from .lib.switcher import (
+    CHANNEL_CODE_NAMES,
+    CHANNEL_OFF_CODE_NAMES,
+    CHANNEL_ON_CODE_NAMES,
+    SwitcherCode,
+)
+from .models import UnavailablePolicy
+
+
+def validate_code(value: dict) -> dict:
+    """Validate that codes can be encoded."""
+    try:
+        SwitcherCode.from_dict(value)
+    except InvalidCodeError as ex:
+        raise vol.Invalid(str(ex)) from ex
+    return value
+
 
 RF_SERVICE_CONFIG_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ID): cv.service,
         vol.Optional(CONF_SERVICE_DATA): vol.Schema({}, extra=vol.ALLOW_EXTRA),
+        vol.Optional(CONF_BRIDGES): vol.All(cv.ensure_list, [cv.service]),
+        vol.Optional(CONF_PAYLOAD): vol.In([p.value for p in PayloadType]),
+        vol.Optional(CONF_RECEIVE_EVENT): cv.string,
     }
 )
 
-RF_CODE_CONFIG_SCHEMA = vol.Schema(
+RF_CODE_CONFIG_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(CONF_CODE_ON): cv.string,
+            vol.Optional(CONF_CODE_OFF): cv.string,
+            **{vol.Optional(name): cv.string for name in CHANNEL_CODE_NAMES},
+            **{vol.Optional(name): cv.string for name in CHANNEL_ON_CODE_NAMES},
+            **{vol.Optional(name): cv.string for name in CHANNEL_OFF_CODE_NAMES},
+            vol.Optional(CONF_CODE_PREFIX): cv.string,
+            vol.Optional(CONF_CODE_FORMAT): vol.In([f.value for f in CodeFormat]),
+            vol.Optional(CONF_CODE_PROTOCOL): vol.All(
+                vol.Coerce(int), vol.In(PROTOCOLS)
+            ),
+        }
+    ),
+    validate_code,
+)
+
+SWITCHER_OPTIONS_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_CODE_ON): cv.string,
-        vol.Required(CONF_CODE_OFF): cv.string,
-        vol.Required(CONF_CODE_A): cv.string,
-        vol.Required(CONF_CODE_B): cv.string,
-        vol.Required(CONF_CODE_C): cv.string,
-        vol.Required(CONF_CODE_D): cv.string,
-        vol.Optional(CONF_CODE_PREFIX): cv.string,
+        vol.Optional(CONF_STATELESS): cv.boolean,
+        vol.Optional(CONF_AWAIT_TRANSMISSION): cv.boolean,
+        vol.Optional(CONF_BATCH_WINDOW): vol.All(
+            vol.Coerce(float), vol.Range(min=0.0, max=1.0)
+        ),
+        vol.Optional(CONF_RESYNC_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(CONF_UNAVAILABLE_POLICY): vol.In(
+            [policy.value for policy in UnavailablePolicy]
+        ),
     }
 )
 
-SWITCHER_OPTIONS_SCHEMA = vol.Schema({vol.Optional(CONF_STATELESS): cv.boolean})
-
 SWITCHER_CONFIG_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): cv.string,
@@ -54,3 +101,28 @@ SWITCHER_CONFIG_SCHEMA = vol.Schema(
         vol.Optional(CONF_TRANSMISSION_GAP): vol.Range(min=0.0, max=1.0),
     }
 )
+
+COORDINATOR_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SOCKET): cv.string,
+        vol.Optional(CONF_SERVE, default=False): cv.boolean,
+    }
+)
+
+
+def validate_coordinator(value: dict) -> dict:
+    """Validate coordinator config, rejecting switchers using its slug."""
+    if isinstance(value, dict) and CONF_CODE in value:
+        raise vol.Invalid(
+            f"Slug {CONF_COORDINATOR} is reserved for the coordinator config, "
+            "give this switcher another slug"
+        )
+    return COORDINATOR_CONFIG_SCHEMA(value)
+
+
+DOMAIN_CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_COORDINATOR): validate_coordinator,
+        cv.slug: SWITCHER_CONFIG_SCHEMA,
+    }
+)
@@ -0,0 +1,138 @@
+"""Sensor platform for RF Four Channel integration."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import BRIDGE_MODEL, DOMAIN, MANUFACTURER, STATS_UPDATE_INTERVAL
+from .models import RfSwitcher
+from .stats import BridgeStats, async_get_bridge_stats
+
+SCAN_INTERVAL = timedelta(seconds=STATS_UPDATE_INTERVAL)
+
+
+@dataclass(frozen=True, kw_only=True)
+class RfBridgeSensorEntityDescription(SensorEntityDescription):
+    """Description of RF bridge sensor."""
+
+    value_fn: Callable[[BridgeStats], float | int | None]
+
+
+SENSOR_TYPES: tuple[RfBridgeSensorEntityDescription, ...] = (
+    RfBridgeSensorEntityDescription(
+        key="throughput",
+        name="Throughput",
+        icon="mdi:access-point",
+        native_unit_of_measurement="codes/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.throughput,
+    ),
+    RfBridgeSensorEntityDescription(
+        key="average_latency",
+        name="Average latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.average_latency,
+    ),
+    RfBridgeSensorEntityDescription(
+        key="queue_depth",
+        name="Queue depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.queue_depth,
+    ),
+    RfBridgeSensorEntityDescription(
+        key="saved_transmissions",
+        name="Saved transmissions",
+        icon="mdi:layers-triple",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda stats: stats.saved,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> bool:
+    """Set up RF Four Channel Sensor from a config entry."""
+    switcher: RfSwitcher = hass.data[DOMAIN].get(entry.entry_id)
+
+    for bridge_id in switcher.bridges:
+        stats = async_get_bridge_stats(hass, bridge_id)
+
+        # Bridge sensors are shared, one entry using a bridge provides them
+        # and hands them over to another one when it is unloaded.
+        stats.providers[entry.entry_id] = _create_add_sensors(
+            stats, entry.entry_id, async_add_entities
+        )
+        entry.async_on_unload(_create_release_ownership(stats, entry.entry_id))
+        if stats.owner is None:
+            stats.providers[entry.entry_id]()
+
+    return True
+
+
+def _create_add_sensors(
+    stats: BridgeStats, entry_id: str, async_add_entities: AddEntitiesCallback
+):
+    @callback
+    def _add_sensors() -> None:
+        stats.owner = entry_id
+        async_add_entities(
+            RfBridgeSensor(stats, description) for description in SENSOR_TYPES
+        )
+
+    return _add_sensors
+
+
+def _create_release_ownership(stats: BridgeStats, entry_id: str):
+    @callback
+    def _release_ownership() -> None:
+        stats.providers.pop(entry_id, None)
+        if stats.owner != entry_id:
+            return
+        stats.owner = None
+        if stats.providers:
+            next(iter(stats.providers.values()))()
+
+    return _release_ownership
+
+
+class RfBridgeSensor(SensorEntity):
+    """Entity class for RF bridge statistics sensor."""
+
+    _attr_has_entity_name = True
+
+    entity_description: RfBridgeSensorEntityDescription
+
+    def __init__(
+        self, stats: BridgeStats, description: RfBridgeSensorEntityDescription
+    ) -> None:
+        """Initialize sensor."""
+        self.entity_description = description
+        self._stats = stats
+        self._attr_unique_id = f"{DOMAIN}_bridge_{stats.bridge_id}_{description.key}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"bridge_{stats.bridge_id}")},
+            manufacturer=MANUFACTURER,
+            model=BRIDGE_MODEL,
+            name=stats.bridge_id,
+        )
+        self._attr_native_value = description.value_fn(stats)
+
+    async def async_update(self) -> None:
+        """Update sensor from bridge stats."""
+        self._attr_native_value = self.entity_description.value_fn(self._stats)
@@ -2,16 +2,44 @@
 
 import logging
 
+import voluptuous as vol
+
 from homeassistant.components import persistent_notification
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import entity_platform
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, ServiceCall, callback
+from homeassistant.helpers import config_validation as cv, entity_platform
+from homeassistant.helpers.service import async_register_admin_service
 
 from .const import (
+    ATTR_DURATION,
+    ATTR_FILENAME,
+    ATTR_PERSIST,
+    DEFAULT_RECORDING_FILENAME,
     DOMAIN,
     SERVICE_DUMMY_RF_SEND,
     SERVICE_INTERNAL_STATE_OFF,
     SERVICE_INTERNAL_STATE_ON,
+    SERVICE_PROFILE_START,
+    SERVICE_PROFILE_STOP,
+    SERVICE_RECORD_START,
+    SERVICE_RECORD_STOP,
+    SERVICE_SNAPSHOT_CREATE,
+    SERVICE_SNAPSHOT_RESTORE,
+)
+
+RECORD_START_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_FILENAME, default=DEFAULT_RECORDING_FILENAME): cv.string}
 )
+PROFILE_START_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_DURATION): vol.All(vol.Coerce(float), vol.Range(min=1))}
+)
+SNAPSHOT_CREATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME): cv.string,
+        vol.Optional(ATTR_PERSIST, default=True): cv.boolean,
+    }
+)
+SNAPSHOT_RESTORE_SCHEMA = vol.Schema({vol.Required(CONF_NAME): cv.string})
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +60,119 @@ def async_setup_dummy_rf_send_service(hass: HomeAssistant):
     hass.services.async_register(DOMAIN, SERVICE_DUMMY_RF_SEND, _dummy_rf_send_service)
 
 
+@callback
+def async_setup_recording_services(hass: HomeAssistant):
+    """Set services recording queued RF codes for offline replay."""
+    if hass.services.has_service(DOMAIN, SERVICE_RECORD_START):
+        return
+
+    # recordings are only imported once a service is called
+    # pylint: disable=import-outside-toplevel
+
+    async def _record_start_service(call: ServiceCall) -> None:
+        from .recording import async_recording_path, async_start_recording
+
+        path = await async_recording_path(hass, call.data[ATTR_FILENAME])
+        async_start_recording(hass, path)
+
+    async def _record_stop_service(call: ServiceCall) -> None:
+        from .recording import async_stop_recording
+
+        await async_stop_recording(hass)
+
+    async def _async_stop_recording(event: Event) -> None:
+        from .recording import async_get_recording, async_stop_recording
+
+        if async_get_recording(hass) is not None:
+            await async_stop_recording(hass)
+
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_RECORD_START, _record_start_service, RECORD_START_SCHEMA
+    )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_RECORD_STOP, _record_stop_service
+    )
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_recording)
+
+
+@callback
+def async_setup_profile_services(hass: HomeAssistant):
+    """Set services capturing a cProfile of the RF pipeline."""
+    if hass.services.has_service(DOMAIN, SERVICE_PROFILE_START):
+        return
+
+    # cProfile is only imported once a capture is requested
+    # pylint: disable=import-outside-toplevel
+
+    async def _profile_start_service(call: ServiceCall) -> None:
+        from .profiling import async_start_profile
+
+        async_start_profile(hass, call.data.get(ATTR_DURATION))
+
+    async def _profile_stop_service(call: ServiceCall) -> None:
+        from .profiling import async_stop_profile
+
+        if (path := await async_stop_profile(hass)) is not None:
+            persistent_notification.async_create(
+                hass,
+                message=f"Profile written to {path}.",
+                title="RF Four Channel",
+                notification_id="rf4ch_profile",
+            )
+
+    async def _async_stop_profile(event: Event) -> None:
+        from .profiling import async_stop_profile
+
+        await async_stop_profile(hass)
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_PROFILE_START,
+        _profile_start_service,
+        PROFILE_START_SCHEMA,
+    )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_PROFILE_STOP, _profile_stop_service
+    )
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_profile)
+
+
+@callback
+def async_setup_snapshot_services(hass: HomeAssistant):
+    """Set services saving and restoring channel states of all switchers."""
+    if hass.services.has_service(DOMAIN, SERVICE_SNAPSHOT_CREATE):
+        return
+
+    # snapshot storage is only imported once a service is called
+    # pylint: disable=import-outside-toplevel
+
+    async def _snapshot_create_service(call: ServiceCall) -> None:
+        from .snapshot import async_get_snapshots
+
+        await async_get_snapshots(hass).async_create(
+            call.data[CONF_NAME], call.data[ATTR_PERSIST]
+        )
+
+    async def _snapshot_restore_service(call: ServiceCall) -> None:
+        from .snapshot import async_get_snapshots
+
+        await async_get_snapshots(hass).async_restore(call.data[CONF_NAME])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT_CREATE,
+        _snapshot_create_service,
+        SNAPSHOT_CREATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT_RESTORE,
+        _snapshot_restore_service,
+        SNAPSHOT_RESTORE_SCHEMA,
+    )
+
+
 @callback
 def async_setup_device_services(hass: HomeAssistant):
     """Create device specific services."""
@@ -0,0 +1,109 @@
+"""Fleet snapshots for RF Four Channel integration."""
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, SNAPSHOT_STORAGE_KEY, SNAPSHOT_STORAGE_VERSION
+from .models import RfSwitcher
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_SNAPSHOTS = "RF_SNAPSHOTS"
+
+
+class RfSnapshots:
+    """Named channel states of all switchers, optionally persisted."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize snapshots."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, int]]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY
+        )
+        self._persisted: dict[str, dict[str, int]] | None = None
+        self._memory: dict[str, dict[str, int]] = {}
+        self._lock = asyncio.Lock()
+
+    def _switchers(self) -> list[RfSwitcher]:
+        """Return switchers of loaded entries tracking their state."""
+        data = self.hass.data.get(DOMAIN, {})
+        return [
+            switcher
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if (switcher := data.get(entry.entry_id)) is not None
+            and not switcher.is_stateless
+        ]
+
+    async def _async_load(self) -> dict[str, dict[str, int]]:
+        """Return persisted snapshots, loaded once."""
+        if self._persisted is None:
+            self._persisted = await self._store.async_load() or {}
+        return self._persisted
+
+    async def async_create(self, name: str, persist: bool) -> int:
+        """Snapshot state of every switcher, return number of switchers."""
+        snapshot = {
+            switcher.unique_id: switcher.state for switcher in self._switchers()
+        }
+        async with self._lock:
+            persisted = await self._async_load()
+            if persist:
+                self._memory.pop(name, None)
+                persisted[name] = snapshot
+                await self._store.async_save(persisted)
+            else:
+                if persisted.pop(name, None) is not None:
+                    await self._store.async_save(persisted)
+                self._memory[name] = snapshot
+        _LOGGER.debug("Snapshot %s holds %s switchers", name, len(snapshot))
+        return len(snapshot)
+
+    async def async_restore(self, name: str) -> int:
+        """Move switchers back to snapshot, return number of switchers moved.
+
+        Switchers already matching the snapshot send nothing, the others
+        send the cheapest code sequence reaching it. Switchers failing to
+        move, e.g. unavailable ones dropping their codes, are reported once
+        all others are moved.
+        """
+        if (snapshot := self._memory.get(name)) is None:
+            snapshot = (await self._async_load()).get(name)
+        if snapshot is None:
+            raise HomeAssistantError(f"No snapshot named {name}")
+
+        moves = {
+            switcher.unique_id: switcher.async_set_state(state)
+            for switcher in self._switchers()
+            if (state := snapshot.get(switcher.unique_id)) is not None
+            and state != switcher.state
+        }
+        results = await asyncio.gather(*moves.values(), return_exceptions=True)
+        failed = {
+            unique_id: result
+            for unique_id, result in zip(moves, results)
+            if isinstance(result, BaseException)
+        }
+        moved = len(moves) - len(failed)
+        _LOGGER.debug("Restored %s switchers from snapshot %s", moved, name)
+        if failed:
+            details = ", ".join(
+                f"{unique_id} ({ex})" for unique_id, ex in failed.items()
+            )
+            raise HomeAssistantError(
+                f"Restored {moved} switchers from snapshot {name}, "
+                f"failed to restore {details}"
+            )
+        return moved
+
+
+@callback
+def async_get_snapshots(hass: HomeAssistant) -> RfSnapshots:
+    """Get shared snapshots."""
+    data = hass.data.setdefault(DOMAIN, {})
+    if ATTR_SNAPSHOTS not in data:
+        data[ATTR_SNAPSHOTS] = RfSnapshots(hass)
+    return data[ATTR_SNAPSHOTS]
@@ -0,0 +1,66 @@
+"""Bridge statistics for RF Four Channel integration."""
+
+from collections import deque
+from collections.abc import Callable
+import time
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, STATS_WINDOW
+
+ATTR_BRIDGE_STATS = "RF_BRIDGE_STATS"
+
+
+class BridgeStats:
+    """Rolling transmission statistics for one RF bridge."""
+
+    def __init__(self, bridge_id: str, window: float = STATS_WINDOW) -> None:
+        """Initialize bridge stats."""
+        self.bridge_id = bridge_id
+        self.owner: str | None = None
+        # entries able to add the bridge sensors, by entry id
+        self.providers: dict[str, Callable[[], None]] = {}
+        self.queue_depth = 0
+        self.transmitted = 0
+        self.saved = 0
+        self._window = window
+        self._samples: deque[tuple[float, float]] = deque()
+
+    def record(self, latency: float) -> None:
+        """Record a transmitted code with its latency in seconds."""
+        now = time.monotonic()
+        self.transmitted += 1
+        self._samples.append((now, latency))
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        """Drop samples older than the window."""
+        limit = now - self._window
+        while self._samples and self._samples[0][0] < limit:
+            self._samples.popleft()
+
+    @property
+    def throughput(self) -> float:
+        """Return transmitted codes per minute over the window."""
+        self._prune(time.monotonic())
+        return round(len(self._samples) * 60 / self._window, 2)
+
+    @property
+    def average_latency(self) -> float | None:
+        """Return average latency in milliseconds over the window."""
+        self._prune(time.monotonic())
+        if not self._samples:
+            return None
+        total = sum(latency for _, latency in self._samples)
+        return round(total / len(self._samples) * 1000, 1)
+
+
+@callback
+def async_get_bridge_stats(hass: HomeAssistant, bridge_id: str) -> BridgeStats:
+    """Get or create stats for bridge."""
+    registry: dict[str, BridgeStats] = hass.data.setdefault(DOMAIN, {}).setdefault(
+        ATTR_BRIDGE_STATS, {}
+    )
+    if bridge_id not in registry:
+        registry[bridge_id] = BridgeStats(bridge_id)
+    return registry[bridge_id]
@@ -4,13 +4,21 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
-from .lib.switcher import SwitcherChannel
+from .const import DOMAIN, GROUP_SWITCH_KEY
+from .lib.switcher import SwitcherAction, SwitcherChannel
 from .models import RfSwitcher
 from .services import async_setup_device_services
+from .tracing import command_trace
+
+CHANNEL_NAMES = tuple(f"Ch {chr(ord('A') + channel)}" for channel in SwitcherChannel)
+CHANNEL_ICONS = tuple(
+    f"mdi:numeric-{channel + 1}-box" if channel < 9 else "mdi:numeric-9-plus-box"
+    for channel in SwitcherChannel
+)
 
 
 async def async_setup_entry(
@@ -18,6 +26,9 @@ async def async_setup_entry(
 ) -> bool:
     """Set up RF Four Channel Switch from a config entry."""
     switcher: RfSwitcher = hass.data[DOMAIN].get(entry.entry_id)
+    for channel in switcher.channels:
+        switcher.attach_entity(Platform.SWITCH, channel, RfSwitch(switcher, channel))
+    switcher.attach_entity(Platform.SWITCH, GROUP_SWITCH_KEY, RfGroupSwitch(switcher))
     entites = switcher.get_entities_for_platform(Platform.SWITCH)
 
     async_add_entities(entites)
@@ -36,22 +47,26 @@ class RfSwitch(SwitchEntity, RestoreEntity):
         """Initialize switch."""
         self._switcher = switcher
         self._channel = channel
-        self._attr_name = f"Ch {chr(ord('A') + channel)}"
-        self._attr_unique_id = f"{DOMAIN}_{switcher.unique_id}_{channel}"
-        self._attr_device_info = switcher.device_info
-        self._attr_is_on = switcher.get_channel(channel)
-        self._attr_available = switcher.available
-        self._attr_icon = f"mdi:numeric-{channel+1}-box"
 
     @property
     def name(self) -> str:
         """Return name."""
-        return self._attr_name
+        return CHANNEL_NAMES[self._channel]
+
+    @property
+    def icon(self) -> str:
+        """Return icon."""
+        return CHANNEL_ICONS[self._channel]
 
     @property
     def unique_id(self) -> str:
         """Return unique ID."""
-        return self._attr_unique_id
+        return f"{DOMAIN}_{self._switcher.unique_id}_{self._channel}"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared with the switcher."""
+        return self._switcher.device_info
 
     @property
     def available(self) -> str:
@@ -63,19 +78,21 @@ class RfSwitch(SwitchEntity, RestoreEntity):
         """Return true if switch is on."""
         return self._switcher.get_channel(self._channel)
 
-    def turn_on(self, **kwargs) -> None:
+    async def async_turn_on(self, **kwargs) -> None:
         """Turn on switch."""
-        self._switcher.set_channel(self._channel, True)
+        with command_trace(self.entity_id, self._context):
+            await self._switcher.async_set_channel(self._channel, True)
 
-    def turn_off(self, **kwargs) -> None:
+    async def async_turn_off(self, **kwargs) -> None:
         """Turn off switch."""
-        self._switcher.set_channel(self._channel, False)
+        with command_trace(self.entity_id, self._context):
+            await self._switcher.async_set_channel(self._channel, False)
 
-    def override_on(self, **kwargs):
+    async def override_on(self, **kwargs):
         """Override internal state On."""
         self._switcher.set_channel(self._channel, True, only_internal=True)
 
-    def override_off(self, **kwargs):
+    async def override_off(self, **kwargs):
         """Override internal state Off."""
         self._switcher.set_channel(self._channel, False, only_internal=True)
 
@@ -90,3 +107,56 @@ class RfSwitch(SwitchEntity, RestoreEntity):
             self._switcher.set_channel(
                 self._channel, last_state.state == STATE_ON, only_internal=True
             )
+
+
+class RfGroupSwitch(SwitchEntity):
+    """Entity class switching all channels of the switcher with one code."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_name = "All"
+    _attr_icon = "mdi:toggle-switch-variant"
+
+    def __init__(self, switcher: RfSwitcher) -> None:
+        """Initialize switch."""
+        self._switcher = switcher
+
+    @property
+    def unique_id(self) -> str:
+        """Return unique ID."""
+        return f"{DOMAIN}_{self._switcher.unique_id}_{GROUP_SWITCH_KEY}"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared with the switcher."""
+        return self._switcher.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return the availability of the switch."""
+        return self._switcher.available
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if any channel is on."""
+        return not self._switcher.is_stateless and self._switcher.state != 0
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Turn on all channels."""
+        with command_trace(self.entity_id, self._context):
+            await self._switcher.async_handle_action(SwitcherAction.ON)
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Turn off all channels."""
+        with command_trace(self.entity_id, self._context):
+            await self._switcher.async_handle_action(SwitcherAction.OFF)
+
+    async def override_on(self, **kwargs):
+        """Override internal state of all channels On."""
+        for channel in self._switcher.channels:
+            self._switcher.set_channel(channel, True, only_internal=True)
+
+    async def override_off(self, **kwargs):
+        """Override internal state of all channels Off."""
+        for channel in self._switcher.channels:
+            self._switcher.set_channel(channel, False, only_internal=True)
@@ -1,62 +1,64 @@
 """Switcher Device for RF Four Channel integration."""
 
 import asyncio
-from dataclasses import dataclass
+from collections.abc import Callable
 import logging
-from typing import TypedDict
+import time
 
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import TemplateError
+from homeassistant.exceptions import HomeAssistantError, TemplateError
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo, Entity
 from homeassistant.helpers.event import TrackTemplate, async_track_template_result
 from homeassistant.helpers.template import Template
 
-from .button import RfButton
+from . import tracing
+from .const import (
+    AIRTIME_GUARD,
+    ATTR_REPEAT,
+    CONF_BRIDGES,
+    CONF_PAYLOAD,
+    CONF_RECEIVE_EVENT,
+    DOMAIN,
+    EVENT_CODE_TRANSMITTED,
+    GROUP_SWITCH_KEY,
+    IDEMPOTENT_SEND_RETRIES,
+)
+from .lib.encoding import PayloadType, code_airtime, encode_payload
+from .lib.scheduler import CodeDropped, QueueItem, RfScheduler
 from .lib.switcher import (
+    CHANNEL_CODE_NAMES,
     Switcher as InternalSwitcher,
     SwitcherAction,
     SwitcherChannel,
-    SwitcherCodeDict,
+    apply_code_name,
+    plan_sync,
+    plan_transition,
 )
-from .switch import RfSwitch
+from .models import SwitcherConfig, SwitcherOptions, UnavailablePolicy
+from .receiver import async_get_receiver
+from .recording import async_get_recording
+from .resync import async_get_resync
+from .stats import async_get_bridge_stats
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class RfServiceDict(TypedDict):
-    """RF service dictionary."""
-
-    id: str
-    data: dict
-
-
-@dataclass(frozen=True)
-class SwitcherOptions:
-    """Switcher options."""
-
-    stateless: bool
-
-
-@dataclass(frozen=True)
-class SwitcherConfig:
-    """Switcher config."""
-
-    name: str
-    unique_id: str
-    code: SwitcherCodeDict
-    service: RfServiceDict
-    availability_template: str
-    transmission_gap: float | None
-    device_info: DeviceInfo
-
-
 class EntityStore:
     """Entity store."""
 
-    def __init__(self) -> None:
-        """Initialize entity store."""
+    __slots__ = ("_store", "_on_update")
+
+    def __init__(self, on_update: Callable[[], None] | None = None) -> None:
+        """Initialize entity store, on_update is called after entities update."""
         self._store: dict = {}
+        self._on_update = on_update
+
+    def _updated(self) -> None:
+        """Report entity update."""
+        if self._on_update is not None:
+            self._on_update()
 
     def attach(self, platform: Platform, key: str, entity: Entity) -> None:
         """Attach entity with platform to entity store."""
@@ -86,32 +88,61 @@ class EntityStore:
     def mark_for_update(self, platform: Platform, key: str) -> None:
         """Update entity in entity store."""
         entity = self.get(platform, key)
-        if entity.hass is not None:
-            entity.schedule_update_ha_state()
+        if entity is not None and entity.hass is not None:
+            entity.async_write_ha_state()
+        self._updated()
 
     def mark_platform_for_update(self, platform: Platform) -> None:
         """Update all entities for platform in entity store."""
         for entity in self.get_for_platform(platform):
             if entity.hass is not None:
-                entity.schedule_update_ha_state()
+                entity.async_write_ha_state()
+        self._updated()
 
     def mark_all_for_update(self) -> None:
         """Update all entities in entity store."""
         for entities in self._store.values():
             for entity in entities.values():
                 if entity.hass is not None:
-                    entity.schedule_update_ha_state()
+                    entity.async_write_ha_state()
+        self._updated()
 
 
 class RfSwitcher:
     """Class for RF Four Channel Switcher."""
 
+    __slots__ = (
+        "hass",
+        "_config",
+        "_options",
+        "_queue",
+        "_switcher",
+        "_labels",
+        "_payloads",
+        "_stats",
+        "_entity_store",
+        "_available",
+        "_parked",
+        "_air_state",
+        "_unsub_track_template",
+        "_unsub_receiver",
+        "_unsub_resync",
+        "_unsub_live_feed",
+        "_live_feed",
+        "_synced_at",
+        "_transmissions",
+        "_batch_target",
+        "_batch_changes",
+        "_batch_waiters",
+        "_batch_handle",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
         config: SwitcherConfig,
         options: SwitcherOptions = SwitcherOptions(stateless=False),
-        queue: asyncio.Queue | None = None,
+        queue: RfScheduler | None = None,
     ) -> None:
         """Initialize switcher."""
         self.hass = hass
@@ -119,16 +150,25 @@ class RfSwitcher:
         self._options = options
         self._queue = queue
         self._switcher = InternalSwitcher(config.code, self._queue_rf_code)
-        self._entity_store = EntityStore()
+        self._labels: dict[str, str] | None = None
+        self._payloads: dict[str, str | list[int]] | None = None
+        self._stats = async_get_bridge_stats(hass, self.bridge_id)
+        self._entity_store = EntityStore(self._async_entities_updated)
         self._available = True
+        self._parked = False
+        self._air_state = self._switcher.state
 
         self._unsub_track_template = None
-
-        # Initialise channel switches
-        for channel in SwitcherChannel:
-            self._entity_store.attach(Platform.SWITCH, channel, RfSwitch(self, channel))
-        for action in SwitcherAction:
-            self._entity_store.attach(Platform.BUTTON, action, RfButton(self, action))
+        self._unsub_receiver = None
+        self._unsub_resync = None
+        self._unsub_live_feed = None
+        self._live_feed = None
+        self._synced_at = time.monotonic()
+        self._transmissions: list[asyncio.Future] | None = None
+        self._batch_target: int | None = None
+        self._batch_changes = 0
+        self._batch_waiters: list[asyncio.Future] = []
+        self._batch_handle: asyncio.TimerHandle | None = None
 
     @property
     def name(self) -> str:
@@ -156,9 +196,54 @@ class RfSwitcher:
         return self._options.stateless
 
     @property
-    def transmission_gap(self) -> float | None:
-        """Return transmission gap in seconds."""
-        return self._config.transmission_gap
+    def bridge_id(self) -> str:
+        """Return id of the RF bridge service."""
+        return self._config.service["id"]
+
+    @property
+    def bridges(self) -> tuple[str, ...]:
+        """Return ids of RF bridge services able to reach the switcher."""
+        return (self.bridge_id, *self._config.service.get(CONF_BRIDGES, ()))
+
+    @property
+    def channel_count(self) -> int:
+        """Return number of channels."""
+        return self._switcher.channel_count
+
+    @property
+    def channels(self) -> tuple[SwitcherChannel, ...]:
+        """Return channels of the switcher."""
+        return self._switcher.channels
+
+    @property
+    def state(self) -> int:
+        """Return channel state bitmask."""
+        return self._switcher.state
+
+    @property
+    def codes(self) -> dict[str, str]:
+        """Return encoded codes by name."""
+        return dict(self._switcher.code.items())
+
+    @property
+    def synced_at(self) -> float:
+        """Return monotonic time the whole state was last sent."""
+        return self._synced_at
+
+    def get_transmission_gap(self, code: str) -> float:
+        """Return seconds to keep the bridge quiet after sending code.
+
+        Without a configured gap this is the airtime of the code, including
+        repeats asked from the bridge, plus a guard interval.
+        """
+        if self._config.transmission_gap is not None:
+            return self._config.transmission_gap
+        data = self._config.service.get("data") or {}
+        try:
+            repeat = int(data.get(ATTR_REPEAT, 1))
+        except (TypeError, ValueError):
+            repeat = 1
+        return code_airtime(code, self._switcher.code.protocol, repeat) + AIRTIME_GUARD
 
     def get_channel(self, channel: SwitcherChannel) -> bool:
         """Get channel state."""
@@ -166,31 +251,198 @@ class RfSwitcher:
             return False
         return self._switcher.get_channel(channel)
 
+    @callback
     def set_channel(
         self, channel: SwitcherChannel, state: bool, only_internal: bool = False
     ):
         """Set channel state."""
         if self.is_stateless:
             if not only_internal:
-                self._switcher.toggle_channel(channel, False)
+                self._switcher.send_channel(channel, state)
+        elif not only_internal and self._options.batch_window > 0:
+            self._batch_channel(channel, state)
         else:
             self._switcher.set_channel(channel, state, only_internal)
+            if only_internal:
+                # overrides and restores tell what the receiver has
+                bit = 1 << channel
+                air = self._air_state
+                self._air_state = air | bit if state else air & ~bit
+                if (target := self._batch_target) is not None:
+                    # and replace a batched command, the flush must not undo them
+                    self._batch_target = target | bit if state else target & ~bit
             self._entity_store.mark_for_update(Platform.SWITCH, channel)
+            self._entity_store.mark_for_update(Platform.SWITCH, GROUP_SWITCH_KEY)
 
+    @callback
+    def _batch_channel(self, channel: SwitcherChannel, state: bool) -> None:
+        """Merge channel command into the batch sent when the window closes."""
+        if (target := self._batch_target) is None:
+            target = self._switcher.state
+        bit = 1 << channel
+        self._batch_target = target | bit if state else target & ~bit
+        if self._batch_target != target:
+            self._batch_changes += 1
+
+        if self._transmissions is not None:
+            waiter = self.hass.loop.create_future()
+            self._batch_waiters.append(waiter)
+            self._transmissions.append(waiter)
+
+        if self._batch_handle is None:
+            self._batch_handle = self.hass.loop.call_later(
+                self._options.batch_window, self._flush_batch
+            )
+
+    @callback
+    def _flush_batch(self) -> None:
+        """Send batched commands as cheapest code sequence."""
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        if (target := self._batch_target) is None:
+            return
+        if self._drops_codes():
+            self._cancel_batch()
+            return
+
+        changes, waiters = self._batch_changes, self._batch_waiters
+        self._batch_target = None
+        self._batch_changes = 0
+        self._batch_waiters = []
+
+        outer = self._transmissions
+        self._transmissions = [] if waiters else None
+        try:
+            sent = self._switcher.set_state(target)
+        finally:
+            transmissions, self._transmissions = self._transmissions, outer
+
+        if saved := changes - sent:
+            self._stats.saved += saved
+            _LOGGER.debug(
+                "Batched %s changes of %s into %s codes", changes, self.unique_id, sent
+            )
+        self._entity_store.mark_platform_for_update(Platform.SWITCH)
+
+        if transmissions:
+            self.hass.async_create_task(
+                self._async_resolve_batch(waiters, transmissions)
+            )
+        else:
+            for waiter in waiters:
+                waiter.set_result(None)
+
+    @staticmethod
+    async def _async_resolve_batch(
+        waiters: list[asyncio.Future], transmissions: list[asyncio.Future]
+    ) -> None:
+        """Resolve batched commands once their codes are sent."""
+        results = await asyncio.gather(*transmissions, return_exceptions=True)
+        error = next((r for r in results if isinstance(r, BaseException)), None)
+        for waiter in waiters:
+            if waiter.done():
+                continue
+            if error is None:
+                waiter.set_result(None)
+            elif isinstance(error, asyncio.CancelledError):
+                waiter.set_exception(CodeDropped("RF code dropped"))
+            else:
+                waiter.set_exception(error)
+
+    @callback
+    def _cancel_batch(self) -> None:
+        """Forget batched commands without sending them."""
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        for waiter in self._batch_waiters:
+            waiter.set_exception(CodeDropped("Batched command dropped"))
+        self._batch_target = None
+        self._batch_changes = 0
+        self._batch_waiters = []
+
+    async def async_set_channel(self, channel: SwitcherChannel, state: bool) -> None:
+        """Set channel state, optionally waiting for the code to be sent."""
+        await self._async_run_command(self.set_channel, channel, state)
+
+    @callback
     def turn_on_all(self):
         """Turn on all channels."""
+        self._flush_batch()
+        if self._switcher.code.channel_on is not None:
+            self._synced_at = time.monotonic()
         self._switcher.turn_on_all()
         self._entity_store.mark_platform_for_update(Platform.SWITCH)
 
+    @callback
     def turn_off_all(self):
         """Turn off all channels."""
+        self._flush_batch()
+        if self._switcher.code.channel_off is not None:
+            self._synced_at = time.monotonic()
         self._switcher.turn_off_all()
         self._entity_store.mark_platform_for_update(Platform.SWITCH)
 
+    @callback
+    def set_state(self, state: int) -> int:
+        """Move all channels to state bitmask, return number of codes sent."""
+        self._flush_batch()
+        state &= (1 << self.channel_count) - 1
+        if self.is_stateless or state == self._switcher.state:
+            return 0
+        sent = self._switcher.set_state(state)
+        self._entity_store.mark_platform_for_update(Platform.SWITCH)
+        return sent
+
+    async def async_set_state(self, state: int) -> None:
+        """Move all channels to state, optionally waiting for the codes."""
+        await self._async_run_command(self.set_state, state)
+
+    @callback
     def sync_channels(self):
         """Sync channels."""
-        self._switcher.sync_channels()
+        self._flush_batch()
+        if not self._switcher.sync_channels():
+            _LOGGER.warning(
+                "Switcher %s has no on or off code to sync from", self.unique_id
+            )
+            return
+        self._synced_at = time.monotonic()
+
+    def resync_due(self, now: float) -> bool:
+        """Return True when a background resync is due."""
+        interval = self._options.resync_interval * 60
+        return (
+            interval > 0
+            and self._available
+            and not self.is_stateless
+            and self._batch_target is None
+            and now - self._synced_at >= interval
+            # discrete codes never leave a channel inverted
+            and not self._switcher.code.discrete
+            and plan_sync(self._switcher.code, 0) is not None
+        )
 
+    @callback
+    def async_request_resync(self) -> None:
+        """Queue background resync, planned when the queue gets to it."""
+        if self._queue is not None:
+            self._queue.put_background(self, self._expand_resync, self.bridges)
+
+    def _expand_resync(self) -> list[QueueItem]:
+        """Return queue items forcing the current state."""
+        if (codes := plan_sync(self._switcher.code, self._switcher.state)) is None:
+            return []
+        self._synced_at = time.monotonic()
+        self._stats.queue_depth += len(codes)
+        bridges = self.bridges
+        return [
+            QueueItem(self, code, queued_at=self._synced_at, bridges=bridges)
+            for code in codes
+        ]
+
+    @callback
     def handle_action(self, action: SwitcherAction):
         """Handle action."""
         if action == SwitcherAction.ON:
@@ -200,44 +452,333 @@ class RfSwitcher:
         if action == SwitcherAction.SYNC:
             self.sync_channels()
 
+    async def async_handle_action(self, action: SwitcherAction) -> None:
+        """Handle action, optionally waiting for the codes to be sent."""
+        await self._async_run_command(self.handle_action, action)
+
+    async def _async_run_command(self, command, *args) -> None:
+        """Run command and wait for its transmissions when configured."""
+        if self._drops_codes():
+            raise HomeAssistantError(
+                f"Switcher {self.unique_id} is unavailable and drops its codes"
+            )
+        if not self._options.await_transmission:
+            command(*args)
+            return
+
+        self._transmissions = transmissions = []
+        try:
+            command(*args)
+        finally:
+            self._transmissions = None
+
+        if not transmissions:
+            return
+        results = await asyncio.gather(*transmissions, return_exceptions=True)
+        error = next((r for r in results if isinstance(r, BaseException)), None)
+        if isinstance(error, (CodeDropped, asyncio.CancelledError)):
+            raise HomeAssistantError(
+                f"RF code of {self.unique_id} was dropped before it was sent"
+            ) from error
+        if error is not None:
+            raise error
+
+    @callback
+    def async_handle_received_code(self, name: str) -> None:
+        """Update state from code received by the bridge."""
+        if self.is_stateless:
+            return
+        if self._switcher.handle_received_code(name):
+            self._apply_to_air(name)
+            self._entity_store.mark_platform_for_update(Platform.SWITCH)
+
+    def attach_entity(self, platform: Platform, key: str, entity: Entity) -> None:
+        """Attach entity created by platform to follow switcher state."""
+        self._entity_store.attach(platform, key, entity)
+
     def get_entities_for_platform(self, platform: Platform) -> list[Entity]:
         """Get entities for platform."""
         return self._entity_store.get_for_platform(platform)
 
     def update_options(self, options: SwitcherOptions):
         """Update options."""
+        if options == self._options:
+            return
         self._options = options
+        self._entity_store.mark_all_for_update()
+
+    async def async_update_config(self, config: SwitcherConfig) -> None:
+        """Apply changed config in place, keeping entities and channel state."""
+        old = self._config
+        if config == old:
+            return
+
+        self._config = config
+
+        if config.code != old.code:
+            self._switcher.update_code(config.code)
+            self._labels = None
+
+        if config.code != old.code or config.service != old.service:
+            self._payloads = None
+            self._async_setup_receiver()
 
+        if config.service["id"] != old.service["id"]:
+            pending = self._queue.pending(self) if self._queue is not None else 0
+            self._stats.queue_depth -= pending
+            self._stats = async_get_bridge_stats(self.hass, self.bridge_id)
+            self._stats.queue_depth += pending
+
+        if config.availability_template != old.availability_template:
+            self._async_setup_availability()
+
+        if config.name != old.name:
+            registry = dr.async_get(self.hass)
+            if device := registry.async_get_device(
+                identifiers={(DOMAIN, self.unique_id)}
+            ):
+                registry.async_update_device(device.id, name=config.name)
+
+    @property
+    def code_labels(self) -> dict[str, str]:
+        """Return code names by encoded code, built on first use."""
+        if self._labels is None:
+            self._labels = {code: name for name, code in self._switcher.code.items()}
+        return self._labels
+
+    def _get_payload(self, code: str) -> str | list[int]:
+        """Return payload expected by the bridge, encoded once per code."""
+        if self._payloads is None:
+            payload_type = PayloadType(
+                self._config.service.get(CONF_PAYLOAD) or PayloadType.RC_SWITCH
+            )
+            self._payloads = {
+                code: encode_payload(code, payload_type, self._switcher.code.protocol)
+                for code in self.code_labels
+            }
+        return self._payloads.get(code, code)
+
+    @callback
     def _queue_rf_code(self, code: str):
         """Queue RF code."""
-        if self._queue:
-            self.hass.loop.call_soon_threadsafe(
-                self._queue.put_nowait, {"switcher": self, "code": code}
+        if not self._available and self._park_rf_code():
+            return
+
+        trace = tracing.fork_current_trace()
+        if (recording := async_get_recording(self.hass)) is not None:
+            recording.record(
+                self.unique_id,
+                self.code_labels.get(code),
+                code,
+                self.get_transmission_gap(code),
             )
+        if self._queue is not None:
+            item = QueueItem(
+                self,
+                code,
+                trace=trace,
+                bridges=self.bridges,
+                retries=0 if self._is_toggle(code) else IDEMPOTENT_SEND_RETRIES,
+            )
+            if self._transmissions is not None:
+                item.future = self.hass.loop.create_future()
+                self._transmissions.append(item.future)
+            if trace is not None:
+                trace.mark(tracing.SPAN_ENQUEUE)
+            self._stats.queue_depth += 1
+            self._queue.put(item)
         else:
-            self.send_rf_code(code)
+            task = self.hass.async_create_task(self._async_send_unqueued(code, trace))
+            if self._transmissions is not None:
+                self._transmissions.append(task)
+
+    def _is_toggle(self, code: str) -> bool:
+        """Return True when sending code twice would undo it."""
+        return self.code_labels.get(code, CHANNEL_CODE_NAMES[0]) in CHANNEL_CODE_NAMES
+
+    async def _async_send_unqueued(
+        self, code: str, trace: tracing.RfTrace | None
+    ) -> None:
+        """Send RF code right away when there is no queue."""
+        self._apply_to_air(self.code_labels.get(code))
+        send_duration = await self.async_send_rf_code(code, trace)
+        self.async_code_transmitted(code, 0.0, send_duration)
+        tracing.async_emit_trace(self.hass, trace, self.unique_id, code)
+
+    @callback
+    def async_cancel_pending(self) -> int:
+        """Drop codes of this switcher still waiting in the queue."""
+        return len(self._drop_pending())
 
     @callback
-    def send_rf_code(self, code: str):
-        """Send RF code."""
-        domain, service = self._config.service["id"].split(".")
+    def _drop_pending(self) -> list[QueueItem]:
+        """Remove and return codes of this switcher waiting in the queue."""
+        if self._queue is None:
+            return []
+        dropped = self._queue.drop(self)
+        self._stats.queue_depth -= len(dropped)
+        return dropped
+
+    @callback
+    def _apply_to_air(self, name: str | None) -> None:
+        """Follow state the receivers get to with named code."""
+        if name is None:
+            return
+        state = apply_code_name(self._air_state, name, self.channel_count)
+        if state is not None:
+            self._air_state = state
+
+    def _drops_codes(self) -> bool:
+        """Return True while the unavailable policy drops codes."""
+        return (
+            not self._available
+            and self._options.unavailable_policy == UnavailablePolicy.DROP
+        )
+
+    @callback
+    def _park_rf_code(self) -> bool:
+        """Return True when the unavailable policy keeps code off the air."""
+        policy = self._options.unavailable_policy
+        if policy == UnavailablePolicy.SEND:
+            return False
+        self._parked = self._parked or policy == UnavailablePolicy.HOLD
+        return True
+
+    @callback
+    def _set_available(self, available: bool | None) -> None:
+        """Set availability, parking and releasing codes as configured."""
+        was_available, self._available = bool(self._available), available
+        policy = self._options.unavailable_policy
+        if policy == UnavailablePolicy.SEND or was_available == bool(available):
+            return
+
+        if not available:
+            dropped = self._drop_pending()
+            self._parked = bool(dropped) and policy == UnavailablePolicy.HOLD
+            if policy == UnavailablePolicy.DROP:
+                self._cancel_batch()
+                if not self.is_stateless and self._air_state != self.state:
+                    # the receivers never got the dropped codes
+                    self._switcher.set_state(self._air_state, only_internal=True)
+                    self._entity_store.mark_platform_for_update(Platform.SWITCH)
+            _LOGGER.debug(
+                "Switcher %s unavailable, dropped %s queued codes",
+                self.unique_id,
+                len(dropped),
+            )
+            return
+
+        if not self._parked:
+            return
+        self._parked = False
+        if policy != UnavailablePolicy.HOLD:
+            return
+
+        codes = plan_transition(self._switcher.code, self._air_state, self.state)
+        _LOGGER.debug(
+            "Switcher %s available again, sending %s codes to reach its state",
+            self.unique_id,
+            len(codes),
+        )
+        for rf_code in codes:
+            self._queue_rf_code(rf_code)
+
+    async def async_transmit(self, item: QueueItem, bridge: str) -> None:
+        """Transmit RF code taken from the queue on bridge."""
+        if item.trace is not None:
+            item.trace.mark(tracing.SPAN_DEQUEUE)
+        self._apply_to_air(self.code_labels.get(item.code))
+        queue_wait = time.monotonic() - item.queued_at
+        send_duration = await self.async_send_rf_code(item.code, item.trace, bridge)
+        self.async_code_transmitted(item.code, queue_wait, send_duration, bridge)
+
+    @callback
+    def async_transmission_done(self, item: QueueItem) -> None:
+        """Release queue slot of item once it is sent or given up."""
+        self._stats.queue_depth -= 1
+
+    async def async_send_rf_code(
+        self,
+        code: str,
+        trace: tracing.RfTrace | None = None,
+        bridge: str | None = None,
+    ) -> float:
+        """Send RF code and return seconds spent in the service call."""
+        if trace is not None:
+            trace.mark(tracing.SPAN_SERVICE_START)
+        started = time.monotonic()
+        if self._unsub_receiver is not None:
+            async_get_receiver(self.hass).async_code_sent(code)
+        domain, service = (bridge or self.bridge_id).split(".")
         extra_service_data = self._config.service.get("data", None) or {}
-        self.hass.services.call(domain, service, {"code": code, **extra_service_data})
+        payload = self._get_payload(code)
+        await self.hass.services.async_call(
+            domain, service, {"code": payload, **extra_service_data}, blocking=True
+        )
+        if trace is not None:
+            trace.mark(tracing.SPAN_SERVICE_END)
+        return time.monotonic() - started
+
+    @callback
+    def async_code_transmitted(
+        self,
+        code: str,
+        queue_wait: float,
+        send_duration: float,
+        bridge: str | None = None,
+    ) -> None:
+        """Record transmitted RF code and notify listeners."""
+        bridge = bridge or self.bridge_id
+        stats = (
+            self._stats
+            if bridge == self.bridge_id
+            else async_get_bridge_stats(self.hass, bridge)
+        )
+        stats.record(queue_wait + send_duration)
+        self.hass.bus.async_fire(
+            EVENT_CODE_TRANSMITTED,
+            {
+                "switcher": self.unique_id,
+                "bridge": bridge,
+                "code": code,
+                "label": self.code_labels.get(code),
+                "queue_wait": round(queue_wait, 4),
+                "send_duration": round(send_duration, 4),
+            },
+        )
 
     def _update_availability(self, result):
         """Update availability based on template result."""
         try:
-            self._available = bool(result)
+            self._set_available(bool(result))
         except TemplateError as ex:
-            self._available = False
+            self._set_available(False)
             _LOGGER.error("Error rendering availability template: %s", ex)
         finally:
             self._entity_store.mark_all_for_update()
 
-    async def async_added_to_hass(self):
-        """Set switcher."""
+    @callback
+    def _async_setup_receiver(self) -> None:
+        """Register codes with the receive path of the bridge."""
+        if self._unsub_receiver is not None:
+            self._unsub_receiver()
+            self._unsub_receiver = None
+
+        if (event_type := self._config.service.get(CONF_RECEIVE_EVENT)) is not None:
+            self._unsub_receiver = async_get_receiver(self.hass).async_register(
+                self, event_type
+            )
+
+    @callback
+    def _async_setup_availability(self) -> None:
+        """Track availability template."""
+        if self._unsub_track_template is not None:
+            self._unsub_track_template()
+            self._unsub_track_template = None
 
         if self._config.availability_template is None:
+            self._set_available(True)
+            self._entity_store.mark_all_for_update()
             return
 
         @callback
@@ -247,7 +788,7 @@ class RfSwitcher:
             result = updates.pop().result
 
             if isinstance(result, TemplateError):
-                self._available = None
+                self._set_available(None)
             else:
                 self._update_availability(result)
 
@@ -261,8 +802,43 @@ class RfSwitcher:
         # initial template result
         self._update_availability(_template.async_render())
 
+    @callback
+    def _async_entities_updated(self) -> None:
+        """Report state shown by the entities to live feed subscribers."""
+        if self._live_feed is not None:
+            self._live_feed.async_state_changed(self)
+
+    async def async_added_to_hass(self):
+        """Set switcher."""
+        self._async_setup_receiver()
+        self._async_setup_availability()
+        if self._queue is not None and (resync := async_get_resync(self.hass)):
+            self._unsub_resync = resync.async_register(self)
+        # pylint: disable-next=import-outside-toplevel
+        from .live import async_get_live_feed
+
+        self._live_feed = async_get_live_feed(self.hass)
+        self._unsub_live_feed = self._live_feed.async_register(self)
+
     async def async_will_remove_from_hass(self):
         """Remove switcher."""
+        self._cancel_batch()
+
+        if dropped := self.async_cancel_pending():
+            _LOGGER.debug("Dropped %s queued RF codes of %s", dropped, self.unique_id)
+
+        if self._unsub_receiver is not None:
+            self._unsub_receiver()
+            self._unsub_receiver = None
+
+        if self._unsub_resync is not None:
+            self._unsub_resync()
+            self._unsub_resync = None
+
+        if self._unsub_live_feed is not None:
+            self._unsub_live_feed()
+            self._unsub_live_feed = None
+            self._live_feed = None
 
         if self._unsub_track_template is not None:
             self._unsub_track_template()
@@ -0,0 +1,112 @@
+"""Command tracing for RF Four Channel integration."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import logging
+import random
+import time
+from uuid import uuid4
+
+from homeassistant.core import Context, HomeAssistant, callback
+
+from .const import EVENT_COMMAND_TRACE, TRACE_SAMPLE_RATE
+
+_LOGGER = logging.getLogger(__name__)
+
+SPAN_DISPATCH = "dispatch"
+SPAN_ENQUEUE = "enqueue"
+SPAN_DEQUEUE = "dequeue"
+SPAN_SERVICE_START = "service_start"
+SPAN_SERVICE_END = "service_end"
+SPAN_GAP_END = "gap_end"
+
+_CURRENT_TRACE: ContextVar["RfTrace | None"] = ContextVar(
+    "rf4ch_current_trace", default=None
+)
+
+
+@dataclass
+class RfTrace:
+    """Timestamps of a single RF code on its way to the bridge."""
+
+    trace_id: str
+    origin: str | None
+    marks: dict[str, float] = field(default_factory=dict)
+
+    def mark(self, span: str) -> None:
+        """Record monotonic timestamp for span."""
+        self.marks[span] = time.monotonic()
+
+    def fork(self) -> "RfTrace":
+        """Return a copy sharing trace id and marks recorded so far."""
+        return RfTrace(self.trace_id, self.origin, dict(self.marks))
+
+    def durations(self) -> dict[str, float]:
+        """Return milliseconds spent between consecutive spans."""
+        result = {}
+        previous = None
+        for span, ts in self.marks.items():
+            if previous is not None:
+                result[span] = round((ts - previous) * 1000, 3)
+            previous = ts
+
+        if len(self.marks) > 1:
+            values = list(self.marks.values())
+            result["total"] = round((values[-1] - values[0]) * 1000, 3)
+
+        return result
+
+
+@contextmanager
+def command_trace(
+    origin: str | None, context: Context | None = None
+) -> Iterator[RfTrace]:
+    """Start a trace for a command issued by an entity."""
+    trace = RfTrace(context.id if context is not None else uuid4().hex, origin)
+    trace.mark(SPAN_DISPATCH)
+    token = _CURRENT_TRACE.set(trace)
+    try:
+        yield trace
+    finally:
+        _CURRENT_TRACE.reset(token)
+
+
+def fork_current_trace() -> RfTrace | None:
+    """Return a per-code copy of the trace active in this context."""
+    trace = _CURRENT_TRACE.get()
+    if trace is None:
+        return None
+    return trace.fork()
+
+
+@callback
+def async_emit_trace(
+    hass: HomeAssistant, trace: RfTrace | None, switcher_id: str, code: str
+) -> None:
+    """Log trace and fire sampled trace event."""
+    if trace is None:
+        return
+
+    durations = trace.durations()
+    _LOGGER.debug(
+        "Trace %s (%s) for %s code %s: %s",
+        trace.trace_id,
+        trace.origin,
+        switcher_id,
+        code,
+        durations,
+    )
+
+    if random.random() < TRACE_SAMPLE_RATE:
+        hass.bus.async_fire(
+            EVENT_COMMAND_TRACE,
+            {
+                "trace_id": trace.trace_id,
+                "origin": trace.origin,
+                "switcher": switcher_id,
+                "code": code,
+                "durations": durations,
+            },
+        )
@@ -0,0 +1,7 @@
+"""Test setup for RF Four Channel Switcher."""
+
+from pathlib import Path
+import sys
+
+# the Home Assistant free core is imported as lib, like its command line tools
+sys.path.insert(0, str(Path(__file__).parents[1] / "custom_components" / "rf4ch"))
@@ -0,0 +1,119 @@
+"""Tests for the RF transmission scheduler."""
+
+import asyncio
+from collections.abc import Hashable
+
+import pytest
+
+from lib.scheduler import CodeDropped, QueueItem, RfScheduler
+
+GAP = 0.01  # in seconds
+
+
+async def _async_send_all(scheduler: RfScheduler) -> list[QueueItem]:
+    """Run scheduler until its queue drained, return items left over."""
+    worker = asyncio.create_task(scheduler.run())
+    try:
+        return await scheduler.drain(1.0)
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+
+def test_background_on_fresh_scheduler() -> None:
+    """Test background work queued before any code is sent."""
+    sent: list[str] = []
+
+    async def _send(item: QueueItem, bridge: Hashable) -> None:
+        sent.append(item.code)
+
+    async def _run() -> None:
+        scheduler = RfScheduler(_send, lambda item: GAP)
+        scheduler.put_background("a", lambda: [QueueItem("a", "A1")])
+
+        assert await _async_send_all(scheduler) == []
+        assert not scheduler.has_background()
+        assert sent == ["A1"]
+
+    asyncio.run(_run())
+
+
+def test_queued_code_pauses_burst() -> None:
+    """Test code of another switcher is sent before the rest of a burst."""
+    sent: list[str] = []
+    scheduler: RfScheduler
+
+    async def _send(item: QueueItem, bridge: Hashable) -> None:
+        sent.append(item.code)
+        if item.code == "A1":
+            scheduler.put(QueueItem("b", "B1"))
+            scheduler.put(QueueItem("a", "A4"))
+
+    async def _run() -> None:
+        nonlocal scheduler
+        scheduler = RfScheduler(_send, lambda item: GAP)
+        scheduler.put_background(
+            "a", lambda: [QueueItem("a", code) for code in ("A1", "A2", "A3")]
+        )
+
+        assert await _async_send_all(scheduler) == []
+        # codes of the switcher in the burst wait for the burst
+        assert sent == ["A1", "B1", "A2", "A3", "A4"]
+
+    asyncio.run(_run())
+
+
+def test_burst_only_blocks_its_bridge() -> None:
+    """Test bridges the burst isn't sent on keep serving their lanes."""
+    sent: list[tuple[str, Hashable]] = []
+    scheduler: RfScheduler
+
+    async def _send(item: QueueItem, bridge: Hashable) -> None:
+        sent.append((item.code, bridge))
+        if item.code == "A1":
+            scheduler.put(QueueItem("b", "B1", bridges=("y",)))
+
+    async def _run() -> None:
+        nonlocal scheduler
+        scheduler = RfScheduler(_send, lambda item: GAP)
+        scheduler.put_background(
+            "a",
+            lambda: [QueueItem("a", code, bridges=("x",)) for code in ("A1", "A2")],
+            ("x",),
+        )
+
+        assert await _async_send_all(scheduler) == []
+        assert sent.index(("B1", "y")) < sent.index(("A2", "x"))
+
+    asyncio.run(_run())
+
+
+def test_code_dropped_on_air_is_not_resent() -> None:
+    """Test failed code isn't failed over once its switcher was dropped."""
+    sent: list[tuple[str, Hashable]] = []
+    scheduler: RfScheduler
+
+    async def _send(item: QueueItem, bridge: Hashable) -> None:
+        sent.append((item.code, bridge))
+        scheduler.drop(item.key)
+        raise ConnectionError("bridge is gone")
+
+    async def _run() -> None:
+        nonlocal scheduler
+        scheduler = RfScheduler(_send, lambda item: GAP)
+        item = QueueItem(
+            "a",
+            "A1",
+            future=asyncio.get_running_loop().create_future(),
+            bridges=("x", "y"),
+            retries=2,
+        )
+        scheduler.put(item)
+
+        assert await _async_send_all(scheduler) == []
+        assert sent == [("A1", "x")]
+        assert len(scheduler) == 0
+        with pytest.raises(CodeDropped):
+            await item.future
+
+    asyncio.run(_run())